@@ -2,16 +2,27 @@ __author__ = "dmoulder"
 
 from PySide import QtCore, QtGui
 from PySide.QtCore import Signal
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, GEO2D, ReturnDocument, UpdateOne
 import math
+import time
 import datetime
 import getpass
 
 from bson import json_util
 
+from radarItemStore import RadarItemStore
+
 
 _g_client = None
 _g_DB = "itemRadar"
+# Priority rings as drawn by RadarGraphicsScene.setupBackground for the default 800x600 scene.
+# Ring 1 is the centre, anything beyond the outer ring is in ring g_RING_COUNT + 1.
+g_RING_COUNT = 10
+g_RADAR_RADIUS = 550.0
+# Bounds of the 2d index on item positions.  Mongo rejects points outside them so keep this generous.
+g_GEO_BOUND = 100000
+# Live drag positions are ephemeral, Mongo drops them this many seconds after their last update
+g_DRAG_TTL = 10
 _g_localMode = False
 
 
@@ -40,6 +51,11 @@ def init():
             db.create_collection("scenes")
         if "items" not in db.collection_names():
             db.create_collection("items")
+        db.items.create_index([("scene_id", ASCENDING), ("zone", ASCENDING)])
+        db.items.create_index([("scene_id", ASCENDING), ("ring", ASCENDING)])
+        db.items.create_index([("pos", GEO2D), ("scene_id", ASCENDING)], min=-g_GEO_BOUND, max=g_GEO_BOUND)
+        db.drags.create_index([("scene_id", ASCENDING), ("user", ASCENDING)])
+        db.drags.create_index("updated_on", expireAfterSeconds=g_DRAG_TTL)
     except Exception as e:
         return None
 
@@ -47,12 +63,191 @@ def init():
 init()
 
 
+def zoneFromPos(x, y):
+    """
+    Zones are calculated by the co-ordinate system, one per quadrant of the radar
+    :param x: float
+    :param y: float
+    :return: str
+    """
+    if x < 0 and y < 0:
+        return 'P1'
+    if x > 0 > y:
+        return 'P2'
+    if x < 0 < y:
+        return 'P3'
+    if x > 0 and y > 0:
+        return 'P4'
+    return 'X'
+
+
+def ringFromDistance(distance):
+    """
+    Which of the priority rings an item sits in, 1 being the centre of the radar
+    :param distance: float
+    :return: int
+    """
+    ringWidth = g_RADAR_RADIUS / g_RING_COUNT
+    return min(int(distance // ringWidth) + 1, g_RING_COUNT + 1)
+
+
+def positionFields(x, y):
+    """
+    Every field derived from an items position.  These are always written together.
+    :param x: float
+    :param y: float
+    :return: dict
+    """
+    distance = math.sqrt(x*x + y*y)
+    return {"pos": [x, y],
+            "distance": distance,
+            "zone": zoneFromPos(x, y),
+            "ring": ringFromDistance(distance)}
+
+
+_g_internedTags = {}
+
+
+def internTag(tag):
+    """
+    The same handful of tags repeat across most items on a board so every record shares one string per tag
+    :param tag: str
+    :return: str
+    """
+    return _g_internedTags.setdefault(tag, tag)
+
+
+class RadarItemRecord(object):
+    """
+    Compact in memory form of an item document.  The model and the graphics items share these by reference
+    and the conversion to and from the pymongo dict only happens at the storage boundary.
+
+    Position is held as a float pair, colour packed into a single int and tags as a tuple of interned
+    strings.  Dict style access is kept so existing views can keep reading record["name"] etc.
+    """
+    __slots__ = ("_id", "name", "x", "y", "distance", "zone", "ring", "colour", "scene_id", "link",
+                 "description", "comments", "tags", "locked", "locked_by", "created_on", "created_by", "extra")
+
+    # Document keys that map straight onto a slot of the same name
+    _plainKeys = frozenset(["_id", "name", "distance", "zone", "ring", "scene_id", "link", "description",
+                            "comments", "locked", "locked_by", "created_on", "created_by"])
+    _packedKeys = frozenset(["pos", "colour", "tags"])
+
+    def __init__(self):
+        for key in self._plainKeys:
+            setattr(self, key, None)
+        self.x = 0.0
+        self.y = 0.0
+        self.colour = 0
+        self.tags = ()
+        self.extra = None
+
+    def __repr__(self):
+        return "RadarItemRecord(id:{0}, name:{1})".format(self._id, self.name)
+
+    @classmethod
+    def fromDocument(cls, doc):
+        record = cls()
+        record.updateFromDocument(doc)
+        return record
+
+    def updateFromDocument(self, doc):
+        """
+        Refreshes the record in place so anything holding a reference sees the new data
+        :param doc: dict
+        :return: RadarItemRecord
+        """
+        extra = None
+        for key, value in doc.iteritems():
+            if key in self._plainKeys or key in self._packedKeys:
+                self[key] = value
+            else:
+                if extra is None:
+                    extra = {}
+                extra[key] = value
+        self.extra = extra
+        return self
+
+    def changedKeys(self, doc):
+        """
+        Compares a fresh copy of the document against the record
+        :param doc: dict
+        :return: list of the document keys whose values differ
+        """
+        changed = []
+        for key, value in doc.iteritems():
+            if key == "pos":
+                differs = [float(value[0]), float(value[1])] != [self.x, self.y]
+            elif key == "tags":
+                differs = list(value or []) != list(self.tags)
+            else:
+                differs = self.get(key) != value
+            if differs:
+                changed.append(key)
+        return changed
+
+    def toDocument(self):
+        doc = dict(self.extra or {})
+        for key in self._plainKeys:
+            doc[key] = getattr(self, key)
+        for key in self._packedKeys:
+            doc[key] = self[key]
+        return doc
+
+    @staticmethod
+    def packColour(rgb):
+        return (int(rgb[0]) << 16) | (int(rgb[1]) << 8) | int(rgb[2])
+
+    @staticmethod
+    def unpackColour(packed):
+        return [(packed >> 16) & 0xff, (packed >> 8) & 0xff, packed & 0xff]
+
+    def __getitem__(self, key):
+        if key in self._plainKeys:
+            return getattr(self, key)
+        if key == "pos":
+            return [self.x, self.y]
+        if key == "colour":
+            return self.unpackColour(self.colour)
+        if key == "tags":
+            return list(self.tags)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key, value):
+        if key in self._plainKeys:
+            setattr(self, key, value)
+        elif key == "pos":
+            self.x = float(value[0])
+            self.y = float(value[1])
+        elif key == "colour":
+            self.colour = self.packColour(value)
+        elif key == "tags":
+            self.tags = tuple([internTag(t) for t in value or []])
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __contains__(self, key):
+        return key in self._plainKeys or key in self._packedKeys or bool(self.extra and key in self.extra)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+
 class MongoSceneHandle(QtCore.QObject):
 
     item_record_template = {
         "name": "New",
         "pos": [0, 0],
         "distance": 0.0,
+        "zone": "X",
+        "ring": 1,
         "colour": [34, 255, 17],
         "scene_id": None,
         "link": "",
@@ -83,8 +278,8 @@ class MongoSceneHandle(QtCore.QObject):
 
     def __updateItem__(self, idx, data):
         collection = self.db.get_collection("items")
-        collection.find_one_and_update({"_id": idx}, {"$set": data})
-        return self.findItem(idx)
+        return collection.find_one_and_update({"_id": idx, "scene_id": self.sceneId()}, {"$set": data},
+                                              return_document=ReturnDocument.AFTER)
 
     def exportAs(self, path):
         data = {"scene": self._sceneRecord,
@@ -129,6 +324,14 @@ class MongoSceneHandle(QtCore.QObject):
         cursor = self.db.items.find({"scene_id": self.sceneId()})
         return [r for r in cursor]
 
+    def itemRecords(self):
+        """
+        Items converted to the compact in memory form used by the models and graphics items
+        :return: list of RadarItemRecord
+        """
+        cursor = self.db.items.find({"scene_id": self.sceneId()})
+        return [RadarItemRecord.fromDocument(r) for r in cursor]
+
     def isValidScene(self):
         if self._sceneRecord:
             if self.db.scenes.find_one({"_id": self.sceneId()}):
@@ -188,10 +391,206 @@ class MongoSceneHandle(QtCore.QObject):
         return self.__updateItem__(itemId, itemRecord)
 
     def updatePosition(self, itemId, x, y):
-        itemRecord = self.findItem(itemId)
-        itemRecord["pos"] = [x, y]
-        itemRecord["distance"] = math.fabs(math.sqrt(x*x + y*y))
-        return self.__updateItem__(itemId, itemRecord)
+        # pos, distance, zone and ring go in one $set so they can never disagree
+        return self.__updateItem__(itemId, positionFields(x, y))
+
+    def updatePositions(self, positions):
+        """
+        Moves many items in one round trip.  Each item gets the same $set of pos, distance, zone and ring as
+        updatePosition, the writes go in a single unordered bulk_write.
+        :param positions: list of (itemId, x, y)
+        :return: dict of itemId to the fields written
+        """
+        written = {}
+        requests = []
+        sceneId = self.sceneId()
+        for itemId, x, y in positions:
+            fields = positionFields(x, y)
+            written[itemId] = fields
+            requests.append(UpdateOne({"_id": itemId, "scene_id": sceneId}, {"$set": fields}))
+        if requests:
+            self.db.items.bulk_write(requests, ordered=False)
+        return written
+
+    def publishDragPositions(self, positions):
+        """
+        Writes where this user is dragging items to the drags collection.  This is separate from the items, the
+        documents are overwritten in place while the drag lasts and expire on their own if a client goes away.
+        :param positions: list of (itemId, x, y)
+        :return: None
+        """
+        user = getpass.getuser()
+        now = datetime.datetime.utcnow()
+        sceneId = self.sceneId()
+        requests = [UpdateOne({"scene_id": sceneId, "item_id": itemId, "user": user},
+                              {"$set": {"pos": [x, y], "updated_on": now}}, upsert=True)
+                    for itemId, x, y in positions]
+        if requests:
+            self.db.drags.bulk_write(requests, ordered=False)
+
+    def clearDragPositions(self):
+        self.db.drags.delete_many({"scene_id": self.sceneId(), "user": getpass.getuser()})
+
+    def dragPositions(self):
+        """
+        Items other users are dragging right now
+        :return: list of dicts with item_id, pos and user
+        """
+        cursor = self.db.drags.find({"scene_id": self.sceneId(), "user": {"$ne": getpass.getuser()}},
+                                    {"item_id": 1, "pos": 1, "user": 1, "_id": 0})
+        return [r for r in cursor]
+
+    def _updateMany(self, itemIds, update):
+        return self.db.items.update_many({"_id": {"$in": list(itemIds)}, "scene_id": self.sceneId()}, update)
+
+    def setColours(self, itemIds, colour):
+        """
+        Bulk edits take a list of item ids and make a single update_many.  They return the fields written so
+        callers can update their copies without reading the items back.
+        :param itemIds: list of ObjectId
+        :param colour: QtGui.QColor
+        :return: dict
+        """
+        colour = colour.toRgb()
+        fields = {"colour": [colour.red(), colour.green(), colour.blue()]}
+        self._updateMany(itemIds, {"$set": fields})
+        return fields
+
+    def setLinks(self, itemIds, hyperLink):
+        fields = {"link": hyperLink}
+        self._updateMany(itemIds, {"$set": fields})
+        return fields
+
+    def addTags(self, itemIds, tags):
+        self._updateMany(itemIds, {"$addToSet": {"tags": {"$each": list(tags)}}})
+
+    def removeTags(self, itemIds, tags):
+        self._updateMany(itemIds, {"$pullAll": {"tags": list(tags)}})
+
+    def deleteItems(self, itemIds):
+        """
+        :param itemIds: list of ObjectId
+        :return: int, number of items deleted
+        """
+        return self.db.items.delete_many({"_id": {"$in": list(itemIds)}, "scene_id": self.sceneId()}).deleted_count
+
+    def backfillPositionFields(self):
+        """
+        Items saved before zone and ring were persisted are missing the fields.  Writes them in one batch, once
+        per scene, the scene document is flagged afterwards so later opens skip the scan.
+        :return: int, number of items updated
+        """
+        if not self._sceneRecord or self._sceneRecord.get("position_fields"):
+            return 0
+        query = {"scene_id": self.sceneId(),
+                 "$or": [{"zone": {"$exists": False}}, {"ring": {"$exists": False}}]}
+        requests = [UpdateOne({"_id": r["_id"]}, {"$set": positionFields(r["pos"][0], r["pos"][1])})
+                    for r in self.db.items.find(query, {"pos": 1})]
+        if requests:
+            self.db.items.bulk_write(requests, ordered=False)
+        self.db.scenes.update_one({"_id": self.sceneId()}, {"$set": {"position_fields": True}})
+        self._sceneRecord["position_fields"] = True
+        return len(requests)
+
+    def itemsInZone(self, zone):
+        return self.itemsInZones([zone])
+
+    def itemsInZones(self, zones):
+        cursor = self.db.items.find({"scene_id": self.sceneId(), "zone": {"$in": list(zones)}})
+        return [r for r in cursor]
+
+    def itemsWithinRing(self, ring):
+        """
+        Items on ring N or any ring inside it
+        :param ring: int, 1 is the centre ring
+        :return: list
+        """
+        cursor = self.db.items.find({"scene_id": self.sceneId(), "ring": {"$lte": ring}})
+        return [r for r in cursor]
+
+    def _geoItems(self, posQuery, projection=None, **filters):
+        query = {"scene_id": self.sceneId(), "pos": posQuery}
+        query.update(filters)
+        cursor = self.db.items.find(query, projection)
+        return [r for r in cursor]
+
+    def itemsWithinRadius(self, radius, centre=(0.0, 0.0), projection=None):
+        """
+        Items inside a circle, by default centred on the radar
+        :param radius: float
+        :param centre: (x, y)
+        :param projection: optional pymongo projection, eg {"_id": 1}
+        :return: list
+        """
+        return self._geoItems({"$geoWithin": {"$center": [list(centre), radius]}}, projection)
+
+    def itemsInBand(self, innerRadius, outerRadius, projection=None):
+        """
+        Items between two distances from the centre, a priority band
+        """
+        return self._geoItems({"$geoWithin": {"$center": [[0.0, 0.0], outerRadius]}}, projection,
+                              distance={"$gte": innerRadius})
+
+    def itemsInBox(self, bottomLeft, topRight, projection=None):
+        """
+        :param bottomLeft: (x, y)
+        :param topRight: (x, y)
+        """
+        return self._geoItems({"$geoWithin": {"$box": [list(bottomLeft), list(topRight)]}}, projection)
+
+    def itemsInPolygon(self, points, projection=None):
+        """
+        Lasso selection on the server
+        :param points: list of (x, y), the polygon is closed automatically
+        """
+        return self._geoItems({"$geoWithin": {"$polygon": [list(p) for p in points]}}, projection)
+
+    def nearestItems(self, x, y, count=1, maxDistance=None, projection=None):
+        """
+        k nearest neighbours of a point, closest first
+        :param x: float
+        :param y: float
+        :param count: int, k
+        :param maxDistance: optional float
+        :return: list
+        """
+        near = {"$near": [x, y]}
+        if maxDistance is not None:
+            near["$maxDistance"] = maxDistance
+        cursor = self.db.items.find({"scene_id": self.sceneId(), "pos": near}, projection).limit(count)
+        return [r for r in cursor]
+
+    def nearDuplicates(self, tolerance=1.0):
+        """
+        Pairs of items sat on top of each other, most likely the same thing added twice
+        :param tolerance: float, distance under which two items count as duplicates, must be above 0
+        :return: list of (id, id)
+        """
+        if tolerance <= 0:
+            raise ValueError("nearDuplicates tolerance must be positive, got {0}".format(tolerance))
+        # one query for every position, then bucket them into tolerance sized cells so each item is only
+        # compared with the items in its own and the neighbouring cells
+        cells = {}
+        pairs = set()
+        for r in self.db.items.find({"scene_id": self.sceneId()}, {"pos": 1}):
+            x, y = r["pos"][0], r["pos"][1]
+            cx = int(math.floor(x / tolerance))
+            cy = int(math.floor(y / tolerance))
+            for nx in (cx - 1, cx, cx + 1):
+                for ny in (cy - 1, cy, cy + 1):
+                    for otherId, ox, oy in cells.get((nx, ny), ()):
+                        if math.hypot(x - ox, y - oy) <= tolerance:
+                            pairs.add(tuple(sorted([r["_id"], otherId])))
+            cells.setdefault((cx, cy), []).append((r["_id"], x, y))
+        return sorted(pairs)
+
+    def zoneCounts(self):
+        """
+        :return: dict of zone name to number of items
+        """
+        pipeline = [{"$match": {"scene_id": self.sceneId()}},
+                    {"$group": {"_id": "$zone", "count": {"$sum": 1}}}]
+        return dict((r["_id"], r["count"]) for r in self.db.items.aggregate(pipeline))
 
     def postComment(self, itemId, text):
         comment = {"date": datetime.datetime.now(),
@@ -353,15 +752,34 @@ class RadarScenesTableModel(QtCore.QAbstractTableModel):
 class RadarItemsTableModel(QtCore.QAbstractTableModel):
     columns = MongoSceneHandle.scene_template.keys()
 
-    updateGraphicsItemColour = Signal(str, QtGui.QColor)
+    # Native, precomputed keys for sorting.  The proxy would otherwise compare DisplayRole strings.
+    SortRole = QtCore.Qt.UserRole + 1
+    # columns whose sort keys an edit of the field changes, other fields only change their own column
+    sortColumnsFromField = {"pos": ("pos", "distance", "zone", "ring")}
+
+    # item id and the record field that changed, the graphics scene looks the item up and updates it
+    radarItemChanged = Signal(str, str)
+    # the same for a batch of items changed by one edit, eg a multi selection drag
+    radarItemsChanged = Signal(list, str)
+    radarItemInserted = Signal(str)
+    radarItemRemoved = Signal(str)
+    radarItemsRemoved = Signal(list)
 
     def __init__(self, radarMongoScene, parent=None):
         super(RadarItemsTableModel, self).__init__(parent)
         assert isinstance(radarMongoScene, MongoSceneHandle)
         self.radarMongoScene = radarMongoScene
         self.datatable = []
-        self.columns = MongoSceneHandle.item_record_template.keys() + ['zone']
+        self.columns = MongoSceneHandle.item_record_template.keys()
         self.hiddenColumns = [self.columns.index(k) for k in self.columns if k not in ["name", "distance"]]
+        self._sortColumn = None
+        self._sortDescending = False
+        self._sortKeys = []
+        # str item id -> row, rebuilt lazily whenever rows are reordered, inserted or removed
+        self._rowFromId = None
+        # vectorized mirror of positions, colours and tags for scene wide queries
+        self.store = RadarItemStore()
+        self.radarMongoScene.backfillPositionFields()
         self.sync()
 
         self.colourBrush = QtGui.QBrush(QtGui.QColor(255, 0, 0))
@@ -379,20 +797,27 @@ class RadarItemsTableModel(QtCore.QAbstractTableModel):
         if orientation == QtCore.Qt.Horizontal and role == QtCore.Qt.DisplayRole:
             return self.columns[col]
 
-    def rowModelIndexFromId(self, idx):
+    def rowFromId(self, idx):
+        if self._rowFromId is None:
+            self._rowFromId = dict((str(record._id), row) for row, record in enumerate(self.datatable))
+        return self._rowFromId.get(str(idx), -1)
+
+    def rowsFromIds(self, ids):
+        """
+        :param ids: iterable of item ids
+        :return: list of rows, ids not in the model are skipped
+        """
+        rows = [self.rowFromId(idx) for idx in ids]
+        return [row for row in rows if row != -1]
+
+    def indexFromId(self, idx, columnName="name"):
         row = self.rowFromId(idx)
-        data = {}
-        if row != -1:
-            for c in range(self.columnCount()):
-                data[self.columns[c]] = self.index(row, c)
-        return data
+        if row == -1:
+            return QtCore.QModelIndex()
+        return self.index(row, self.columns.index(columnName))
 
-    def rowFromId(self, idx):
-        foundItems = [row for row in self.datatable if str(row["_id"]) == str(idx)]
-        if foundItems:
-            row = self.datatable.index(foundItems[0])
-            return row
-        return -1
+    def _invalidateRows(self):
+        self._rowFromId = None
 
     def rawDataFromRow(self, row):
         return self.datatable[row]
@@ -402,14 +827,303 @@ class RadarItemsTableModel(QtCore.QAbstractTableModel):
         return self.rawDataFromRow(row)
 
     def addNewRadarItem(self):
-        self.datatable.append(self.radarMongoScene.newRadarItem())
+        record = RadarItemRecord.fromDocument(self.radarMongoScene.newRadarItem())
+        self.datatable.append(record)
+        self.store.add(record)
+        if self._rowFromId is not None:
+            self._rowFromId[str(record._id)] = len(self.datatable) - 1
         self.layoutChanged.emit()
-        return self.datatable[-1]
+        self._resortRow(len(self.datatable) - 1)
+        return record
 
     def sync(self):
-        self.datatable = self.radarMongoScene.items()
+        self.datatable = self.radarMongoScene.itemRecords()
+        self.store.rebuild(self.datatable)
+        self._invalidateRows()
+        self.layoutChanged.emit()
+        if self._sortColumn is not None:
+            self.sort(self.columns.index(self._sortColumn),
+                      QtCore.Qt.DescendingOrder if self._sortDescending else QtCore.Qt.AscendingOrder)
+
+    def refresh(self):
+        """
+        Picks up edits made by other users.  Records are updated in place and only the fields that differ are
+        reported through radarItemChanged, new and deleted items are inserted and removed as rows.
+        :return: None
+        """
+        docs = self.radarMongoScene.items()
+        rowFromId = dict((str(record._id), row) for row, record in enumerate(self.datatable))
+        seen = set()
+        added = []
+        changed = []
+        for doc in docs:
+            idx = str(doc["_id"])
+            seen.add(idx)
+            row = rowFromId.get(idx)
+            if row is None:
+                added.append(RadarItemRecord.fromDocument(doc))
+                continue
+            record = self.datatable[row]
+            keys = record.changedKeys(doc)
+            if keys:
+                record.updateFromDocument(doc)
+                self.store.update(record)
+                self.dataChanged.emit(self.index(row, 0), self.index(row, self.columnCount() - 1))
+                changed.append((idx, keys))
+
+        for row in reversed([row for row, record in enumerate(self.datatable) if str(record._id) not in seen]):
+            idx = str(self.datatable[row]._id)
+            self.beginRemoveRows(QtCore.QModelIndex(), row, row)
+            del self.datatable[row]
+            # keep the cached sort keys in step with the rows, a removal alone does not resort
+            if self._sortKeys:
+                del self._sortKeys[row]
+            self._invalidateRows()
+            self.store.remove(idx)
+            self.endRemoveRows()
+            self.radarItemRemoved.emit(idx)
+
+        if added:
+            first = len(self.datatable)
+            self.beginInsertRows(QtCore.QModelIndex(), first, first + len(added) - 1)
+            for record in added:
+                self.datatable.append(record)
+                self.store.add(record)
+            self._invalidateRows()
+            self.endInsertRows()
+            for record in added:
+                self.radarItemInserted.emit(str(record._id))
+
+        for idx, keys in changed:
+            for key in keys:
+                self.radarItemChanged.emit(idx, key)
+
+        if added or changed:
+            self._resortAll()
+
+    def _resortAll(self):
+        if self._sortColumn is not None:
+            self.sort(self.columns.index(self._sortColumn),
+                      QtCore.Qt.DescendingOrder if self._sortDescending else QtCore.Qt.AscendingOrder)
+
+    def _recordsChanged(self, rows, field):
+        """
+        One notification for a batch of records edited in place.  The rows are only resorted when the edit
+        changes the keys of the column the model is sorted on.
+        :param rows: list of int
+        :param field: str
+        :return: None
+        """
+        if not rows:
+            return
+        for row in rows:
+            self.store.update(self.datatable[row])
+        self.dataChanged.emit(self.index(min(rows), 0), self.index(max(rows), self.columnCount() - 1))
+        self.radarItemsChanged.emit([str(self.datatable[row]._id) for row in rows], field)
+        if self._sortColumn in self.sortColumnsFromField.get(field, (field,)):
+            self._resortAll()
+
+    def setColours(self, ids, colour):
+        """
+        Bulk edits, each one makes a single write for all the ids and a single model notification
+        :param ids: list of str item ids
+        :param colour: QtGui.QColor
+        :return: None
+        """
+        rows = self.rowsFromIds(ids)
+        if rows:
+            fields = self.radarMongoScene.setColours([self.datatable[row]._id for row in rows], colour)
+            for row in rows:
+                self.datatable[row]["colour"] = fields["colour"]
+            self._recordsChanged(rows, "colour")
+
+    def setLinks(self, ids, hyperLink):
+        rows = self.rowsFromIds(ids)
+        if rows:
+            self.radarMongoScene.setLinks([self.datatable[row]._id for row in rows], hyperLink)
+            for row in rows:
+                self.datatable[row].link = hyperLink
+            self._recordsChanged(rows, "link")
+
+    def addTags(self, ids, tags):
+        rows = self.rowsFromIds(ids)
+        if rows:
+            # the server applies $addToSet, drop repeats so the records hold each tag once as well
+            unique = []
+            for tag in tags:
+                if tag not in unique:
+                    unique.append(tag)
+            tags = unique
+            self.radarMongoScene.addTags([self.datatable[row]._id for row in rows], tags)
+            for row in rows:
+                record = self.datatable[row]
+                record["tags"] = list(record.tags) + [t for t in tags if t not in record.tags]
+            self._recordsChanged(rows, "tags")
+
+    def removeTags(self, ids, tags):
+        rows = self.rowsFromIds(ids)
+        if rows:
+            self.radarMongoScene.removeTags([self.datatable[row]._id for row in rows], tags)
+            for row in rows:
+                record = self.datatable[row]
+                record["tags"] = [t for t in record.tags if t not in tags]
+            self._recordsChanged(rows, "tags")
+
+    def moveBy(self, ids, dx, dy):
+        # the records know where the items are so this is still a single write
+        positions = []
+        for row in self.rowsFromIds(ids):
+            record = self.datatable[row]
+            positions.append((str(record._id), record.x + dx, record.y + dy))
+        self.setPositions(positions)
+
+    def deleteItems(self, ids):
+        """
+        Deletes the items with one write and removes their rows, a run of adjacent rows at a time
+        :param ids: list of str item ids
+        :return: None
+        """
+        rows = sorted(self.rowsFromIds(ids))
+        if not rows:
+            return
+        removed = [str(self.datatable[row]._id) for row in rows]
+        self.radarMongoScene.deleteItems([self.datatable[row]._id for row in rows])
+        end = len(rows) - 1
+        while end >= 0:
+            start = end
+            while start > 0 and rows[start - 1] == rows[start] - 1:
+                start -= 1
+            first, last = rows[start], rows[end]
+            self.beginRemoveRows(QtCore.QModelIndex(), first, last)
+            for record in self.datatable[first:last + 1]:
+                self.store.remove(record._id)
+            del self.datatable[first:last + 1]
+            if self._sortKeys:
+                del self._sortKeys[first:last + 1]
+            self._invalidateRows()
+            self.endRemoveRows()
+            end = start - 1
+        self.radarItemsRemoved.emit(removed)
+
+    def setPositions(self, positions):
+        """
+        Persists the new positions of many items with one write and one notification
+        :param positions: list of (str item id, x, y)
+        :return: None
+        """
+        moves = []
+        for idx, x, y in positions:
+            row = self.rowFromId(idx)
+            if row != -1:
+                moves.append((row, x, y))
+        if not moves:
+            return
+        written = self.radarMongoScene.updatePositions([(self.datatable[row]._id, x, y) for row, x, y in moves])
+        rows = []
+        for row, x, y in moves:
+            record = self.datatable[row]
+            for key, value in written[record._id].iteritems():
+                record[key] = value
+            rows.append(row)
+        self._recordsChanged(rows, "pos")
+
+    def sortKeyFromRecord(self, record, column_key):
+        """
+        Builds a native key for the column so sorting compares floats, timestamps and lower case
+        strings rather than the formatted display text
+        :param record: RadarItemRecord
+        :param column_key: str
+        :return: object
+        """
+        if column_key == 'zone':
+            return record.zone or zoneFromPos(record.x, record.y)
+        if column_key == "pos":
+            return record.x, record.y
+        if column_key == "colour":
+            return record.colour
+        if column_key == "tags":
+            return ",".join(sorted([n.lower() for n in record.tags if n]))
+        data = record.get(column_key)
+        if column_key == "distance":
+            return float(data or 0.0)
+        if column_key == "created_on":
+            if data is None:
+                return 0.0
+            return time.mktime(data.timetuple()) + data.microsecond / 1e6
+        if column_key == "comments":
+            return len(data or [])
+        if isinstance(data, basestring):
+            return data.lower()
+        return data
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """
+        Sorts the datatable in place on precomputed keys.  The keys are cached in row order so a single
+        edited row can be moved to its new place with a binary search instead of a full resort.
+        :param column: int
+        :param order: QtCore.Qt.SortOrder
+        :return: None
+        """
+        if column < 0 or column >= len(self.columns):
+            self._sortColumn = None
+            self._sortKeys = []
+            return
+        self._sortColumn = self.columns[column]
+        self._sortDescending = order == QtCore.Qt.DescendingOrder
+        keys = [self.sortKeyFromRecord(r, self._sortColumn) for r in self.datatable]
+        sortedRows = sorted(xrange(len(keys)), key=keys.__getitem__, reverse=self._sortDescending)
+
+        self.layoutAboutToBeChanged.emit()
+        newRowFromOld = [0] * len(sortedRows)
+        for newRow, oldRow in enumerate(sortedRows):
+            newRowFromOld[oldRow] = newRow
+        self.datatable = [self.datatable[r] for r in sortedRows]
+        self._sortKeys = [keys[r] for r in sortedRows]
+        self._invalidateRows()
+        oldIndexes = self.persistentIndexList()
+        newIndexes = [self.index(newRowFromOld[i.row()], i.column()) for i in oldIndexes]
+        self.changePersistentIndexList(oldIndexes, newIndexes)
         self.layoutChanged.emit()
 
+    def _resortRow(self, row):
+        """
+        Moves a single edited row to its sorted position and keeps the cached keys in step
+        :param row: int
+        :return: int, the new row
+        """
+        if self._sortColumn is None:
+            return row
+        key = self.sortKeyFromRecord(self.datatable[row], self._sortColumn)
+        keys = self._sortKeys
+        if row == len(keys):
+            keys.append(key)
+        else:
+            keys[row] = key
+
+        # bisect over the keys as if the edited row was already removed
+        lo, hi = 0, len(keys) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            other = keys[mid + 1 if mid >= row else mid]
+            if (key > other) if self._sortDescending else (key < other):
+                hi = mid
+            else:
+                lo = mid + 1
+        newRow = lo
+        if newRow == row:
+            return row
+
+        destination = newRow + 1 if newRow > row else newRow
+        self.beginMoveRows(QtCore.QModelIndex(), row, row, QtCore.QModelIndex(), destination)
+        self.datatable.insert(newRow, self.datatable.pop(row))
+        keys.insert(newRow, keys.pop(row))
+        if self._rowFromId is not None:
+            # only the rows between the old and new place shift
+            for r in xrange(min(row, newRow), max(row, newRow) + 1):
+                self._rowFromId[str(self.datatable[r]._id)] = r
+        self.endMoveRows()
+        return newRow
+
     def columnCount(self, parent=QtCore.QModelIndex()):
         return len(self.columns)
 
@@ -423,10 +1137,13 @@ class RadarItemsTableModel(QtCore.QAbstractTableModel):
         row = self.datatable[index.row()]
         column_key = self.columns[index.column()]
         data = None
+        if role == self.SortRole:
+            if column_key == self._sortColumn:
+                return self._sortKeys[index.row()]
+            return self.sortKeyFromRecord(row, column_key)
+
         if column_key in row:
             data = row[column_key]
-        elif column_key == 'zone':
-            data = row['pos']
 
         if role == QtCore.Qt.DisplayRole:
 
@@ -439,17 +1156,8 @@ class RadarItemsTableModel(QtCore.QAbstractTableModel):
             elif column_key == "distance":
                 return data
             elif column_key == 'zone':
-                # Zones are calculated by the co-ordinate system and note stored in the data
-                x, y = data
-                if x < 0 and y < 0:
-                    return 'P1'
-                if x > 0 > y:
-                    return 'P2'
-                if x < 0 < y:
-                    return 'P3'
-                if x > 0 and y > 0:
-                    return 'P4'
-                return 'X'
+                # Zones are persisted with the position, older records fall back to the co-ordinate system
+                return data or zoneFromPos(row.x, row.y)
             return row[column_key]
 
         if role == QtCore.Qt.BackgroundRole:
@@ -479,12 +1187,15 @@ class RadarItemsTableModel(QtCore.QAbstractTableModel):
                 newData = self.radarMongoScene.setTags(idx, value)
             elif col_name == "colour":
                 newData = self.radarMongoScene.updateColour(idx, value)
-                self.updateGraphicsItemColour.emit(str(idx), value)
             elif col_name == "pos":
                 newData = self.radarMongoScene.updatePosition(idx, value[0], value[1])
             if newData:
-                self.datatable[row] = newData
+                # update in place, the graphics items hold the same record
+                self.datatable[row].updateFromDocument(newData)
+                self.store.update(self.datatable[row])
                 self.dataChanged.emit(index, index)
+                self.radarItemChanged.emit(str(idx), col_name)
+                self._resortRow(row)
 
             return True
         return False
@@ -0,0 +1,415 @@
+__author__ = 'davidm'
+
+import logging as log
+import numpy as np
+
+
+# Zone names indexed by the zone codes held in the store.  X is anything sat on an axis.
+g_ZONES = ("X", "P1", "P2", "P3", "P4")
+g_MAX_TAG_BITS = 64
+
+
+def heatRamp():
+    """
+    256 entry colour ramp for the density heatmap, transparent through blue, green and yellow to red
+    :return: numpy.ndarray of uint32 ARGB
+    """
+    stops = [0.0, 0.15, 0.4, 0.7, 1.0]
+    channels = [[0, 90, 150, 200, 230],      # alpha
+                [0, 20, 40, 255, 255],       # red
+                [0, 60, 200, 230, 40],       # green
+                [0, 200, 80, 40, 20]]        # blue
+    positions = np.linspace(0.0, 1.0, 256)
+    a, r, g, b = [np.interp(positions, stops, c).astype(np.uint32) for c in channels]
+    return (a << 24) | (r << 16) | (g << 8) | b
+
+
+def blurGrid(grid, radius, passes=3):
+    """
+    Approximate gaussian blur, repeated box blurs done with running sums along each axis
+    :param grid: 2d numpy.ndarray
+    :param radius: int, box radius in cells
+    :param passes: int
+    :return: numpy.ndarray
+    """
+    if radius < 1:
+        return grid
+    width = 2 * radius + 1
+    for _ in xrange(passes):
+        for axis in (0, 1):
+            g = np.swapaxes(grid, 0, axis)
+            padded = np.zeros((g.shape[0] + width,) + g.shape[1:], dtype=np.float64)
+            padded[radius + 1:radius + 1 + g.shape[0]] = g
+            sums = np.cumsum(padded, axis=0)
+            grid = np.swapaxes((sums[width:] - sums[:-width]) / width, 0, axis)
+    return grid
+
+
+def heatmapPixels(density, ramp=None):
+    """
+    Maps a density grid onto the colour ramp
+    :param density: 2d numpy.ndarray
+    :param ramp: optional uint32 ramp, see heatRamp
+    :return: 2d numpy.ndarray of uint32 ARGB, C contiguous
+    """
+    if ramp is None:
+        ramp = heatRamp()
+    peak = density.max()
+    if peak <= 0:
+        return np.zeros(density.shape, dtype=np.uint32)
+    levels = (density * (255.0 / peak)).astype(np.uint8)
+    return np.ascontiguousarray(ramp[levels])
+
+
+def zoneCodes(x, y):
+    """
+    Vectorized zone classification, matches radarDBHandle.zoneFromPos
+    :param x: numpy.ndarray
+    :param y: numpy.ndarray
+    :return: numpy.ndarray of int8 codes into g_ZONES
+    """
+    codes = np.zeros(len(x), dtype=np.int8)
+    codes[(x < 0) & (y < 0)] = 1
+    codes[(x > 0) & (y < 0)] = 2
+    codes[(x < 0) & (y > 0)] = 3
+    codes[(x > 0) & (y > 0)] = 4
+    return codes
+
+
+class RadarItemStore(object):
+    """
+    Columnar copy of the layout relevant fields of every item in a scene, kept alongside the
+    RadarItemsTableModel.  Each item owns a slot in a set of NumPy arrays so scene wide work (distances,
+    zones, radius or tag selection) runs vectorized instead of one record at a time.
+
+    Slots are keyed by the item id as a string, the same key the graphics scene uses.  Removing an item
+    moves the last slot into the hole so the arrays stay packed.
+    """
+
+    def __init__(self, capacity=1024):
+        self._ids = []
+        self._slotFromId = {}
+        self._tagBits = {}
+        self._names = []
+        self._nameArray = None
+        self._size = 0
+        self._allocate(capacity)
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, idx):
+        return str(idx) in self._slotFromId
+
+    def _allocate(self, capacity):
+        self._x = np.zeros(capacity, dtype=np.float64)
+        self._y = np.zeros(capacity, dtype=np.float64)
+        self._distance = np.zeros(capacity, dtype=np.float64)
+        self._zone = np.zeros(capacity, dtype=np.int8)
+        self._colour = np.zeros(capacity, dtype=np.uint32)
+        self._tagMask = np.zeros(capacity, dtype=np.uint64)
+
+    def _grow(self, needed):
+        capacity = len(self._x)
+        if needed <= capacity:
+            return
+        while capacity < needed:
+            capacity *= 2
+        for name in ("_x", "_y", "_distance", "_zone", "_colour", "_tagMask"):
+            old = getattr(self, name)
+            new = np.zeros(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, name, new)
+
+    # Views over the live part of each column
+
+    @property
+    def xs(self):
+        return self._x[:self._size]
+
+    @property
+    def ys(self):
+        return self._y[:self._size]
+
+    @property
+    def distances(self):
+        return self._distance[:self._size]
+
+    @property
+    def zones(self):
+        return self._zone[:self._size]
+
+    @property
+    def colours(self):
+        return self._colour[:self._size]
+
+    @property
+    def tagMasks(self):
+        return self._tagMask[:self._size]
+
+    def ids(self):
+        return list(self._ids)
+
+    def slotFromId(self, idx):
+        return self._slotFromId.get(str(idx), -1)
+
+    def tagBit(self, tag, create=False):
+        """
+        Each distinct tag in the scene gets one bit of the uint64 tag mask
+        :param tag: str
+        :param create: bool, assign a bit if the tag has not been seen yet
+        :return: int, 0 when the tag has no bit
+        """
+        bit = self._tagBits.get(tag)
+        if bit is None:
+            if not create:
+                return 0
+            if len(self._tagBits) >= g_MAX_TAG_BITS:
+                log.warning("RadarItemStore : more than {0} tags, '{1}' is not indexed".format(g_MAX_TAG_BITS, tag))
+                self._tagBits[tag] = 0
+                return 0
+            bit = 1 << len(self._tagBits)
+            self._tagBits[tag] = bit
+        return bit
+
+    def tagMask(self, tags, create=False):
+        mask = 0
+        for tag in tags:
+            mask |= self.tagBit(tag, create)
+        return mask
+
+    # Maintenance, driven by the model
+
+    def clear(self):
+        self._ids = []
+        self._slotFromId = {}
+        self._tagBits = {}
+        self._names = []
+        self._nameArray = None
+        self._size = 0
+
+    def rebuild(self, records):
+        """
+        Refills every column from the model's records in one pass
+        :param records: list of RadarItemRecord
+        :return: None
+        """
+        self.clear()
+        count = len(records)
+        self._grow(max(count, 1))
+        self._ids = [str(r._id) for r in records]
+        self._slotFromId = dict((idx, slot) for slot, idx in enumerate(self._ids))
+        self._names = [(r.name or "").lower() for r in records]
+        self._size = count
+        self._x[:count] = np.fromiter((r.x for r in records), dtype=np.float64, count=count)
+        self._y[:count] = np.fromiter((r.y for r in records), dtype=np.float64, count=count)
+        self._distance[:count] = np.fromiter((r.distance or 0.0 for r in records), dtype=np.float64, count=count)
+        self._colour[:count] = np.fromiter((r.colour for r in records), dtype=np.uint32, count=count)
+        self._tagMask[:count] = np.fromiter((self.tagMask(r.tags, create=True) for r in records),
+                                            dtype=np.uint64, count=count)
+        self._zone[:count] = zoneCodes(self.xs, self.ys)
+
+    def add(self, record):
+        idx = str(record._id)
+        if idx in self._slotFromId:
+            return self.update(record)
+        self._grow(self._size + 1)
+        slot = self._size
+        self._size += 1
+        self._ids.append(idx)
+        self._names.append("")
+        self._slotFromId[idx] = slot
+        self._writeSlot(slot, record)
+
+    def update(self, record):
+        slot = self._slotFromId.get(str(record._id))
+        if slot is None:
+            return self.add(record)
+        self._writeSlot(slot, record)
+
+    def remove(self, idx):
+        idx = str(idx)
+        slot = self._slotFromId.pop(idx, None)
+        if slot is None:
+            return
+        last = self._size - 1
+        if slot != last:
+            for column in (self._x, self._y, self._distance, self._zone, self._colour, self._tagMask):
+                column[slot] = column[last]
+            movedId = self._ids[last]
+            self._ids[slot] = movedId
+            self._names[slot] = self._names[last]
+            self._slotFromId[movedId] = slot
+        self._ids.pop()
+        self._names.pop()
+        self._nameArray = None
+        self._size = last
+
+    def _writeSlot(self, slot, record):
+        self._x[slot] = record.x
+        self._y[slot] = record.y
+        self._distance[slot] = record.distance or 0.0
+        self._colour[slot] = record.colour
+        self._tagMask[slot] = self.tagMask(record.tags, create=True)
+        self._names[slot] = (record.name or "").lower()
+        self._nameArray = None
+        self._zone[slot] = zoneCodes(self._x[slot:slot + 1], self._y[slot:slot + 1])[0]
+
+    # Bulk operations
+
+    def recomputeDistances(self):
+        self._distance[:self._size] = np.hypot(self.xs, self.ys)
+        return self.distances
+
+    def recomputeZones(self):
+        self._zone[:self._size] = zoneCodes(self.xs, self.ys)
+        return self.zones
+
+    def recompute(self):
+        self.recomputeDistances()
+        self.recomputeZones()
+
+    def idsFromMask(self, mask):
+        ids = self._ids
+        return [ids[slot] for slot in np.flatnonzero(mask)]
+
+    def selectRadius(self, radius, cx=0.0, cy=0.0):
+        """
+        :param radius: float
+        :param cx: float, centre of the circle.  Defaults to the radar centre
+        :param cy: float
+        :return: list of str ids
+        """
+        dx = self.xs - cx
+        dy = self.ys - cy
+        return self.idsFromMask(dx * dx + dy * dy <= radius * radius)
+
+    def selectRing(self, innerRadius, outerRadius):
+        distances = self.distances
+        return self.idsFromMask((distances >= innerRadius) & (distances < outerRadius))
+
+    def rectMask(self, left, top, right, bottom):
+        xs, ys = self.xs, self.ys
+        return (xs >= left) & (xs <= right) & (ys >= top) & (ys <= bottom)
+
+    def selectRect(self, left, top, right, bottom):
+        return self.idsFromMask(self.rectMask(left, top, right, bottom))
+
+    def selectPolygon(self, points):
+        """
+        Items inside a closed polygon, eg a lasso.  Only the items inside the polygon's bounding box are tested,
+        with an even-odd crossing count run over all of them one edge at a time.
+        :param points: list of (x, y)
+        :return: list of str ids
+        """
+        if len(points) < 3:
+            return []
+        px = np.array([p[0] for p in points], dtype=np.float64)
+        py = np.array([p[1] for p in points], dtype=np.float64)
+        candidates = np.flatnonzero(self.rectMask(px.min(), py.min(), px.max(), py.max()))
+        xs = self.xs[candidates]
+        ys = self.ys[candidates]
+        inside = np.zeros(len(candidates), dtype=bool)
+        j = len(points) - 1
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for i in xrange(len(points)):
+                # edges level with a point never count, so their division by zero is masked out
+                spans = (py[i] > ys) != (py[j] > ys)
+                crossX = (px[j] - px[i]) * (ys - py[i]) / (py[j] - py[i]) + px[i]
+                inside ^= spans & (xs < crossX)
+                j = i
+        ids = self._ids
+        return [ids[slot] for slot in candidates[inside]]
+
+    def selectZone(self, zone):
+        """
+        :param zone: str, one of g_ZONES
+        :return: list of str ids
+        """
+        return self.idsFromMask(self.zones == g_ZONES.index(zone))
+
+    def tagsMask(self, tags, matchAll=False):
+        """
+        Tags without a bit, unknown or past g_MAX_TAG_BITS, are carried by no item.  They are ignored when
+        matching any tag but nothing can match all of them.
+        :return: numpy.ndarray of bool, True for items carrying any, or with matchAll every, tag
+        """
+        bits = [self.tagBit(tag) for tag in tags]
+        if matchAll and not all(bits):
+            return np.zeros(self._size, dtype=bool)
+        mask = 0
+        for bit in bits:
+            mask |= bit
+        mask = np.uint64(mask)
+        if not mask:
+            return np.zeros(self._size, dtype=bool)
+        hits = np.bitwise_and(self.tagMasks, mask)
+        if matchAll:
+            return hits == mask
+        return hits != 0
+
+    def selectTags(self, tags, matchAll=False):
+        return self.idsFromMask(self.tagsMask(tags, matchAll))
+
+    def zonesMask(self, zones):
+        """
+        :param zones: iterable of str, names from g_ZONES
+        :return: numpy.ndarray of bool
+        """
+        codes = [g_ZONES.index(zone) for zone in zones if zone in g_ZONES]
+        return np.isin(self.zones, codes)
+
+    def nameMask(self, text):
+        """
+        Case insensitive substring match on the item names
+        :param text: str
+        :return: numpy.ndarray of bool
+        """
+        if self._nameArray is None:
+            # fixed width text array, rebuilt on the first query after a name changes
+            self._nameArray = np.array(self._names, dtype="U")
+        if not self._size:
+            return np.zeros(0, dtype=bool)
+        return np.char.find(self._nameArray, text.lower()) >= 0
+
+    def filterMask(self, tags=None, zones=None, text=None):
+        """
+        The list panel's filter over the whole store, items with any of the tags, in any of the zones and
+        whose name contains the text.  Empty criteria accept everything.
+        :return: numpy.ndarray of bool, True for accepted items
+        """
+        accepted = np.ones(self._size, dtype=bool)
+        if tags:
+            accepted &= self.tagsMask(tags)
+        if zones:
+            accepted &= self.zonesMask(zones)
+        if text:
+            accepted &= self.nameMask(text)
+        return accepted
+
+    def densityGrid(self, left, top, width, height, size, mask=None):
+        """
+        Item counts on a size x size grid covering a rect, binned in one vectorized pass
+        :param left: float
+        :param top: float
+        :param width: float
+        :param height: float
+        :param size: int, cells per side
+        :param mask: optional bool array, only count these items
+        :return: numpy.ndarray of float64, indexed [row (y), column (x)]
+        """
+        cx = np.floor((self.xs - left) * (float(size) / width)).astype(np.int64)
+        cy = np.floor((self.ys - top) * (float(size) / height)).astype(np.int64)
+        inside = (cx >= 0) & (cx < size) & (cy >= 0) & (cy < size)
+        if mask is not None:
+            inside &= mask
+        cells = cy[inside] * size + cx[inside]
+        grid = np.bincount(cells, minlength=size * size)
+        return grid.astype(np.float64).reshape(size, size)
+
+    def zoneHistogram(self):
+        """
+        :return: dict of zone name to item count
+        """
+        counts = np.bincount(self.zones, minlength=len(g_ZONES))
+        return dict(zip(g_ZONES, [int(n) for n in counts]))
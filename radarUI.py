@@ -5,18 +5,132 @@ __date__ = "05/06/2016"
 from PySide import QtCore, QtGui
 from PySide.QtCore import Signal
 import os
+import math
+import bisect
+from operator import itemgetter
 import logging as log
 import radarAttributeEditorForm
 import radarListForm
 import radarSelectSceneForm
-from radarDBHandle import MongoSceneHandle, RadarScenesTableModel, RadarItemsTableModel, getpass
-import random
+from radarItemStore import blurGrid, heatmapPixels, heatRamp
+from radarDBHandle import MongoSceneHandle, RadarScenesTableModel, RadarItemsTableModel, getpass, g_RING_COUNT
 
 log.basicConfig(level=log.INFO)
 
 g_ROOT_PATH = os.path.dirname(__file__)
 g_RESOURCE_PATH = os.path.join(g_ROOT_PATH, "resources")
 g_IMAGES_PATH = os.path.join(g_RESOURCE_PATH, "images")
+# Largest edge of the cached radar background, deeper zooms just magnify it
+g_MAX_BACKGROUND_PIXELS = 4096
+# Level of detail thresholds for the dots.  Below POINT dots are drawn as flat squares, from DETAIL upwards
+# they are drawn as vectors with their full name.
+g_LOD_POINT = 0.5
+g_LOD_DETAIL = 2.0
+# Below this zoom the dots are replaced by density clusters
+g_CLUSTER_ZOOM = 0.75
+# labels are laid out again only when the zoom moves by more than this factor, or crosses a level of detail
+g_LABEL_ZOOM_STEP = 1.25
+# time the scene may spend creating items per event loop pass while populating
+g_POPULATE_SLICE_MS = 8
+# Sweep frame rates.  The governor drops from TARGET towards MIN when frames cost more than the budget and
+# runs at IDLE while the window does not have focus.
+g_SWEEP_TARGET_FPS = 30.0
+g_SWEEP_IDLE_FPS = 5.0
+g_SWEEP_MIN_FPS = 10.0
+# Live drag.  A client samples its drags at most SAMPLE_HZ and all the clients dragging on a board share
+# SCENE_WRITES writes a second between them.  Other users' drags are read every POLL_MS.
+g_DRAG_SAMPLE_HZ = 10.0
+g_DRAG_SCENE_WRITES = 20.0
+g_DRAG_POLL_MS = 250
+
+
+class RadarDotRenderer(object):
+    """
+    Flyweight shared by every radar dot.  Pens, rects and brushes are built once per state or colour and each
+    dot is blitted from a pre-rasterised sprite cached per (colour, state, device pixel ratio), so painting a
+    dot never allocates Qt objects or rasterises an antialiased ellipse.
+    """
+    NORMAL = 0
+    HIGHLIGHT = 1
+
+    _instance = None
+
+    @classmethod
+    def instance(cls):
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
+
+    def __init__(self):
+        self.penWidth = 2
+        self.pens = {self.NORMAL: QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 50), self.penWidth),
+                     self.HIGHLIGHT: QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255), self.penWidth)}
+        self.diameters = {self.NORMAL: 12, self.HIGHLIGHT: 14}
+        self.dotRects = {}
+        self.boundingRects = {}
+        for state, diameter in self.diameters.iteritems():
+            self.dotRects[state] = QtCore.QRectF(0 - diameter / 2, 0 - diameter / 2, diameter, diameter)
+            # room for the pen and the antialiased edge
+            margin = self.penWidth / 2 + 1
+            self.boundingRects[state] = self.dotRects[state].adjusted(-margin, -margin, margin, margin)
+        # the hovered dot also paints its name tooltip to the right
+        diameter = self.diameters[self.HIGHLIGHT]
+        self.hoverRect = self.boundingRects[self.HIGHLIGHT].united(
+            QtCore.QRectF(0 - diameter / 2, 0 - diameter / 2 - 2, diameter + 36, diameter + 4))
+        self.textPen = self.pens[self.HIGHLIGHT]
+        self.textPos = QtCore.QPoint(12, 4)
+        self.textFont = QtGui.QFont()
+        # zoomed out dots become a small flat square, zoomed in they get their name alongside
+        self.pointRect = QtCore.QRectF(-3, -3, 6, 6)
+        self.labelRect = QtCore.QRectF(9, -4, 48, 8)
+        self.labelFont = QtGui.QFont()
+        self.labelFont.setPixelSize(6)
+        self.labelledRects = dict((state, rect.united(self.labelRect))
+                                  for state, rect in self.boundingRects.iteritems())
+        self.shapes = {}
+        for state, rect in self.dotRects.iteritems():
+            path = QtGui.QPainterPath()
+            path.addEllipse(rect)
+            self.shapes[state] = path
+        self._brushes = {}
+        self._sprites = {}
+
+    def brush(self, rgb):
+        brush = self._brushes.get(rgb)
+        if brush is None:
+            brush = self._brushes[rgb] = QtGui.QBrush(QtGui.QColor.fromRgb(rgb))
+        return brush
+
+    @staticmethod
+    def devicePixelRatio(painter):
+        # Qt4 has no high dpi scaling, the device only has a ratio on Qt5
+        ratio = getattr(painter.device(), "devicePixelRatio", None)
+        return float(ratio()) if ratio else 1.0
+
+    def sprite(self, rgb, state, ratio=1.0):
+        key = (rgb, state, ratio)
+        pixmap = self._sprites.get(key)
+        if pixmap is None:
+            rect = self.boundingRects[state]
+            size = int(math.ceil(rect.width() * ratio))
+            pixmap = QtGui.QPixmap(size, size)
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.scale(ratio, ratio)
+            painter.translate(-rect.x(), -rect.y())
+            painter.setPen(self.pens[state])
+            painter.setBrush(self.brush(rgb))
+            painter.drawEllipse(self.dotRects[state])
+            painter.end()
+            if hasattr(pixmap, "setDevicePixelRatio"):
+                pixmap.setDevicePixelRatio(ratio)
+            self._sprites[key] = pixmap
+        return pixmap
+
+    def paintDot(self, painter, rgb, state):
+        pixmap = self.sprite(rgb, state, self.devicePixelRatio(painter))
+        painter.drawPixmap(self.boundingRects[state], pixmap, QtCore.QRectF(pixmap.rect()))
 
 
 class RadarGraphicsItem(QtGui.QGraphicsItem):
@@ -28,74 +142,109 @@ class RadarGraphicsItem(QtGui.QGraphicsItem):
 
     radarItemHovered = Signal("")
 
+    _rgbSelected = 0xffffff
+
     def __init__(self, parent=None):
         super(RadarGraphicsItem, self).__init__(parent)
         self.setFlags(QtGui.QGraphicsItem.ItemIsSelectable | QtGui.QGraphicsItem.ItemIsMovable)
         self.setFlag(QtGui.QGraphicsItem.ItemSendsGeometryChanges, True)
-        self.brush = QtGui.QBrush(QtGui.QColor.fromRgb(34, 255, 17))
-        self.brushSelected = QtGui.QBrush(QtGui.QColor.fromRgb(255, 255, 255))
-        # self.brushSelected = self.brush
-        # self.brushHover = QtGui.QBrush(QtGui.QColor.fromRgb(255, 255, 255))
-        self.diameter = 12
+        self.renderer = RadarDotRenderer.instance()
+        # colours are packed 0xRRGGBB ints, the renderer owns the brushes
+        self._rgb = 0x22ff11
         self._selected = False
         self._hovering = False
+        self._showLabel = False
         self.setAcceptHoverEvents(True)
         self._cachePos = None
-        self.record = {}
-        self._playing = False
-        self.tl = QtCore.QTimeLine(50)
-        self.tl.setLoopCount(200)
-        self.itemAnimation = QtGui.QGraphicsItemAnimation()
-        self.itemAnimation.setItem(self)
-        self.itemAnimation.setTimeLine(self.tl)
-        self.itemAnimation.setScaleAt(1, 1.5, 1.5)
+
+    @property
+    def record(self):
+        """
+        The item only keeps its id and what it needs to paint, the full record is looked up from the scene's
+        model when it is needed
+        :return: RadarItemRecord or None
+        """
+        scene = self.scene()
+        if scene is None or not hasattr(scene, "recordFromId"):
+            return None
+        return scene.recordFromId(self._id)
+
+    def _pulseDriver(self):
+        return getattr(self.scene(), "pulseDriver", None)
 
     def play(self):
-        if not self.tl.currentValue() > 0:
-            self.tl.start()
+        driver = self._pulseDriver()
+        if driver:
+            driver.start(self)
 
     def stop(self):
-        if self.tl.currentValue() > 0:
-            self.tl.stop()
-            self.tl.setCurrentTime(0)
+        driver = self._pulseDriver()
+        if driver:
+            driver.stop(self)
+
+    def renderState(self):
+        if self._selected or self._hovering or self.isSelected():
+            return RadarDotRenderer.HIGHLIGHT
+        return RadarDotRenderer.NORMAL
+
+    @property
+    def diameter(self):
+        return self.renderer.diameters[self.renderState()]
 
     @property
     def dotRect(self):
-        if any([self._selected, self._hovering, self.isSelected()]):
-            self.diameter = 14
-        else:
-            self.diameter = 12
-        return QtCore.QRectF(0-self.diameter / 2, 0 - self.diameter / 2, self.diameter, self.diameter)
+        return self.renderer.dotRects[self.renderState()]
 
     @property
     def pen(self):
-        if any([self._selected, self._hovering, self.isSelected()]):
-            return QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255), 2)
-        else:
-            return QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 50), 2)
+        return self.renderer.pens[self.renderState()]
 
     def cachePosition(self):
         self._cachePos = self.scenePos()
 
+    def itemChange(self, change, value):
+        if change == QtGui.QGraphicsItem.ItemSelectedChange:
+            # the highlight state is larger so the bounding rect changes with selection
+            self.prepareGeometryChange()
+        elif change == QtGui.QGraphicsItem.ItemPositionHasChanged:
+            scene = self.scene()
+            if scene is not None and hasattr(scene, "radarItemPositionChanged"):
+                scene.radarItemPositionChanged(self)
+        return super(RadarGraphicsItem, self).itemChange(change, value)
+
     def hasMoved(self):
-        return self._cachePos != self.scenePos()
+        return self._cachePos is not None and self._cachePos != self.scenePos()
 
     def setId(self, id):
-        self._id = id
+        self._id = str(id)
 
-    def updateColour(self, idx, colour):
-        if self.id() == idx:
-            log.debug("Update Colour")
-            self.setColour(colour)
-            self.update()
+    def setLocked(self, state):
+        """
+        Items locked by another user can still be selected but not dragged
+        :param state: bool
+        """
+        self.setFlag(QtGui.QGraphicsItem.ItemIsMovable, not state)
+
+    def isLocked(self):
+        return not (self.flags() & QtGui.QGraphicsItem.ItemIsMovable)
 
     def setColour(self, qCol):
-        self.brush = QtGui.QBrush(qCol)
+        self._rgb = qCol.rgb() & 0xffffff
+        scene = self.scene()
+        if scene is not None and hasattr(scene, "radarItemColourChanged"):
+            scene.radarItemColourChanged(self)
+
+    def colour(self):
+        return QtGui.QColor.fromRgb(self._rgb)
+
+    def rgb(self):
+        return self._rgb
 
     def toolTip(self, *args, **kwargs):
-        return self.record.get('name', '')[:4] + ".."
+        return self.label()[:4] + ".."
 
     def hoverEnterEvent(self, *args, **kwargs):
+        self.prepareGeometryChange()
         self._hovering = True
         self.update()
         return super(RadarGraphicsItem, self).hoverEnterEvent(*args, **kwargs)
@@ -107,18 +256,41 @@ class RadarGraphicsItem(QtGui.QGraphicsItem):
         :param kwargs:
         :return:
         """
+        self.prepareGeometryChange()
         self._hovering = False
         self.update()
         return super(RadarGraphicsItem, self).hoverLeaveEvent(*args, **kwargs)
 
     def id(self):
-        return str(self._id)
+        return self._id
+
+    def label(self):
+        record = self.record
+        if record is None:
+            return ""
+        return record.name or ""
+
+    def setShowLabel(self, state):
+        """
+        Zoomed in far enough the dot paints its full name, which needs a wider bounding rect
+        :param state: bool
+        :return: None
+        """
+        if state != self._showLabel:
+            self.prepareGeometryChange()
+            self._showLabel = state
 
     def boundingRect(self, *args, **kwargs):
-        if not self._hovering:
-            return self.dotRect
+        if self._hovering:
+            return self.renderer.hoverRect
+        elif self._showLabel:
+            return self.renderer.labelledRects[self.renderState()]
         else:
-            return QtCore.QRectF(0-self.diameter / 2, 0 - self.diameter / 2 -2, self.diameter + 36, self.diameter+4)
+            return self.renderer.boundingRects[self.renderState()]
+
+    def shape(self):
+        # hit testing and area selection only use the dot, never the label or tooltip area
+        return self.renderer.shapes[self.renderState()]
 
     def paint(self, painter, option, widget, **kwargs):
         """
@@ -131,59 +303,915 @@ class RadarGraphicsItem(QtGui.QGraphicsItem):
         :param kwargs:
         :return: None
         """
+        renderer = self.renderer
+        rgb = self._rgbSelected if self._selected else self._rgb
+        lod = QtGui.QStyleOptionGraphicsItem.levelOfDetailFromTransform(painter.worldTransform())
+        if lod < g_LOD_POINT and not self._hovering:
+            painter.fillRect(renderer.pointRect, renderer.brush(rgb))
+            return
 
-        if self._selected:
-            b = self.brushSelected
-        else:
-            b = self.brush
-        # if self.isSelected():
-        #     b = self.brushSelected
+        state = self.renderState()
         if self._hovering:
             # paint the tooltip.  Remember that when painting new things we need to update the boundingRect
             # so that the item redraws correctly.
-            b = self.brush
-            painter.drawText(QtCore.QPoint( 12, + 4  ) ,self.toolTip())
-        painter.setPen(self.pen)
-        painter.setBrush(b)
-        painter.drawEllipse(self.dotRect)
+            rgb = self._rgb
+            painter.setPen(renderer.textPen)
+            painter.setFont(renderer.textFont)
+            painter.drawText(renderer.textPos, self.toolTip())
+        elif self._showLabel and lod >= g_LOD_DETAIL:
+            painter.setPen(renderer.textPen)
+            painter.setFont(renderer.labelFont)
+            painter.drawText(renderer.labelRect, QtCore.Qt.AlignLeft | QtCore.Qt.AlignVCenter, self.label())
+
+        if lod >= g_LOD_DETAIL:
+            # a magnified sprite would blur, draw the real ellipse
+            painter.setPen(renderer.pens[state])
+            painter.setBrush(renderer.brush(rgb))
+            painter.drawEllipse(renderer.dotRects[state])
+        else:
+            renderer.paintDot(painter, rgb, state)
 
     def mousePressEvent(self, event, **kwargs):
+        self.prepareGeometryChange()
         self._selected = True
         self.update()
         return super(RadarGraphicsItem, self).mousePressEvent(event)
 
     def mouseReleaseEvent(self, event, **kwargs):
+        self.prepareGeometryChange()
         self._selected = False
         self.update()
         return super(RadarGraphicsItem, self).mouseReleaseEvent(event)
 
 
+class RadarPulseDriver(QtCore.QObject):
+    """
+    Scene level scheduler for the pulse animation on the radar dots.  One timer advances the scale of every
+    pulsing item, and only while something is pulsing, so the items themselves own no Qt timers or
+    animation objects.
+    """
+
+    # Matches the old per item QTimeLine: grow to 1.5 over 50ms, repeated 200 times
+    pulseDuration = 50
+    pulseLoops = 200
+    pulseGrowth = 0.5
+
+    defaultInterval = 20
+
+    def __init__(self, parent=None, interval=defaultInterval):
+        super(RadarPulseDriver, self).__init__(parent)
+        self._startTimes = {}
+        self._clock = QtCore.QElapsedTimer()
+        self._clock.start()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval)
+        self._timer.timeout.connect(self.tick)
+
+    def __len__(self):
+        return len(self._startTimes)
+
+    def setInterval(self, interval):
+        self._timer.setInterval(interval)
+
+    def isPulsing(self, item):
+        return item in self._startTimes
+
+    def start(self, item):
+        if item not in self._startTimes:
+            self._startTimes[item] = self._clock.elapsed()
+            if not self._timer.isActive():
+                self._timer.start()
+
+    def stop(self, item):
+        if self._startTimes.pop(item, None) is not None:
+            item.setScale(1.0)
+        if not self._startTimes:
+            self._timer.stop()
+
+    def stopAll(self):
+        for item in self._startTimes.keys():
+            self.stop(item)
+
+    def tick(self):
+        now = self._clock.elapsed()
+        limit = self.pulseDuration * self.pulseLoops
+        finished = []
+        for item, started in self._startTimes.iteritems():
+            elapsed = now - started
+            if elapsed >= limit:
+                finished.append(item)
+            else:
+                phase = (elapsed % self.pulseDuration) / float(self.pulseDuration)
+                item.setScale(1.0 + self.pulseGrowth * phase)
+        for item in finished:
+            self.stop(item)
+
+
+class RadarFrameGovernor(QtCore.QObject):
+    """
+    Frame budget for a scene's animations.  The scene reports the time it spends per frame, updating the sweep
+    and painting, and the governor lowers the frame rate while that cost eats too much of the budget and raises
+    it back towards the target when it drops.  While idle the rate is capped at the idle rate.
+    """
+    rateChanged = Signal(float)
+
+    # fraction of the frame budget the scene may use before the rate is lowered, and below which it is raised
+    downgradeLoad = 0.5
+    upgradeLoad = 0.2
+    # frames between adjustments so one slow frame does not change the rate
+    adjustFrames = 30
+
+    def __init__(self, parent=None, targetFps=g_SWEEP_TARGET_FPS, idleFps=g_SWEEP_IDLE_FPS,
+                 minFps=g_SWEEP_MIN_FPS):
+        super(RadarFrameGovernor, self).__init__(parent)
+        self.targetFps = targetFps
+        self.idleFps = idleFps
+        self.minFps = minFps
+        self.autoDowngrade = True
+        self._fps = targetFps
+        self._idle = False
+        self._cost = 0.0
+        self._average = 0.0
+        self._frames = 0
+
+    def fps(self):
+        if self._idle:
+            return min(self.idleFps, self._fps)
+        return self._fps
+
+    def interval(self):
+        return int(1000.0 / self.fps())
+
+    def setTargetFps(self, fps):
+        self.targetFps = fps
+        self._setFps(fps)
+
+    def setIdleFps(self, fps):
+        before = self.fps()
+        self.idleFps = fps
+        if self.fps() != before:
+            self.rateChanged.emit(self.fps())
+
+    def setIdle(self, state):
+        if state != self._idle:
+            before = self.fps()
+            self._idle = state
+            if self.fps() != before:
+                self.rateChanged.emit(self.fps())
+
+    def isIdle(self):
+        return self._idle
+
+    def _setFps(self, fps):
+        before = self.fps()
+        self._fps = fps
+        self._frames = 0
+        if self.fps() != before:
+            self.rateChanged.emit(self.fps())
+
+    def addCost(self, nsecs):
+        self._cost += nsecs / 1000000.0
+
+    def nextFrame(self):
+        """
+        Closes the frame, folding the cost reported since the last call into a moving average
+        :return: None
+        """
+        self._average = self._average * 0.9 + self._cost * 0.1
+        self._cost = 0.0
+        self._frames += 1
+        if not self.autoDowngrade or self._idle or self._frames < self.adjustFrames:
+            return
+        budget = 1000.0 / self._fps
+        if self._average > budget * self.downgradeLoad and self._fps > self.minFps:
+            log.debug("Sweep frame cost {0:.1f}ms, lowering the frame rate".format(self._average))
+            self._setFps(max(self.minFps, self._fps * 0.75))
+        elif self._average < budget * self.upgradeLoad and self._fps < self.targetFps:
+            self._setFps(min(self.targetFps, self._fps * 1.25))
+        else:
+            self._frames = 0
+
+
+class RadarSweepIndex(object):
+    """
+    Radar items ordered by polar angle so each frame of the sweep only touches the items inside the sector
+    it has crossed since the last frame.  Angles are in degrees, clockwise from 3 o'clock, which matches the
+    rotation applied to the sweep item.  Items outside the radar disc are not indexed as the sweep never
+    reaches them.
+    """
+
+    def __init__(self, radius):
+        self.radius = radius
+        self._angles = []
+        self._items = []
+        self._angleFromItem = {}
+        self._pending = []
+
+    def __len__(self):
+        return len(self._angleFromItem)
+
+    def clear(self):
+        self._angles = []
+        self._items = []
+        self._angleFromItem = {}
+        self._pending = []
+
+    def angleFromPos(self, pos):
+        x, y = pos.x(), pos.y()
+        if x * x + y * y > self.radius * self.radius:
+            return None
+        return math.degrees(math.atan2(y, x)) % 360.0
+
+    def add(self, item):
+        if item in self._angleFromItem:
+            return self.update(item)
+        angle = self.angleFromPos(item.scenePos())
+        if angle is not None:
+            self._angleFromItem[item] = angle
+            # sorted in lazily, a bulk insert is one sort rather than n list inserts
+            self._pending.append((angle, item))
+
+    def remove(self, item):
+        angle = self._angleFromItem.pop(item, None)
+        if angle is None:
+            return
+        self._flush()
+        items = self._items
+        for i in xrange(bisect.bisect_left(self._angles, angle), len(items)):
+            if items[i] is item:
+                del self._angles[i]
+                del items[i]
+                return
+
+    def update(self, item):
+        self.remove(item)
+        self.add(item)
+
+    def _flush(self):
+        if not self._pending:
+            return
+        pending = self._pending
+        self._pending = []
+        if len(pending) < 64:
+            for angle, item in pending:
+                i = bisect.bisect_right(self._angles, angle)
+                self._angles.insert(i, angle)
+                self._items.insert(i, item)
+        else:
+            entries = zip(self._angles, self._items) + pending
+            entries.sort(key=itemgetter(0))
+            self._angles = [e[0] for e in entries]
+            self._items = [e[1] for e in entries]
+
+    def itemsBetween(self, start, end):
+        """
+        Items with an angle in the half open sector (start, end], wrapping past 360
+        :param start: float
+        :param end: float
+        :return: list of RadarGraphicsItem
+        """
+        self._flush()
+        angles = self._angles
+        start %= 360.0
+        end %= 360.0
+        if start <= end:
+            return self._items[bisect.bisect_right(angles, start):bisect.bisect_right(angles, end)]
+        return self._items[bisect.bisect_right(angles, start):] + self._items[:bisect.bisect_right(angles, end)]
+
+
+class RadarClusterLayer(object):
+    """
+    Density clusters drawn in place of the dots when the view is zoomed out.  Dots are bucketed into a pyramid
+    of grids, each level twice the cell size of the one below, and the buckets are updated as dots are added,
+    moved or recoloured so changing zoom never re-buckets the board.  Painting only visits the cells on screen,
+    so the cost follows the screen area rather than the number of items.
+    """
+    baseCellSize = 8.0
+    levels = 7
+    # a cluster glyph wants roughly this many pixels of screen
+    cellPixels = 28.0
+
+    def __init__(self):
+        # cell key -> [count, sum x, sum y, {rgb: count}]
+        self._grids = [{} for _ in range(self.levels)]
+        self._entries = {}
+        self.renderer = RadarDotRenderer.instance()
+        self.pen = QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 120), 1)
+        self.textPen = QtGui.QPen(QtGui.QColor.fromRgb(0, 0, 0))
+        self.font = QtGui.QFont()
+        self.font.setPixelSize(9)
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        self._grids = [{} for _ in range(self.levels)]
+        self._entries = {}
+
+    def cellSize(self, level):
+        return self.baseCellSize * (2 ** level)
+
+    def levelForZoom(self, zoom):
+        for level in range(self.levels):
+            if self.cellSize(level) * zoom >= self.cellPixels:
+                return level
+        return self.levels - 1
+
+    def add(self, item):
+        if item in self._entries:
+            self.remove(item)
+        pos = item.scenePos()
+        x, y, rgb = pos.x(), pos.y(), item.rgb()
+        self._entries[item] = (x, y, rgb)
+        size = self.baseCellSize
+        for grid in self._grids:
+            key = (int(math.floor(x / size)), int(math.floor(y / size)))
+            cell = grid.get(key)
+            if cell is None:
+                cell = grid[key] = [0, 0.0, 0.0, {}]
+            cell[0] += 1
+            cell[1] += x
+            cell[2] += y
+            cell[3][rgb] = cell[3].get(rgb, 0) + 1
+            size *= 2
+
+    def remove(self, item):
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+        x, y, rgb = entry
+        size = self.baseCellSize
+        for grid in self._grids:
+            key = (int(math.floor(x / size)), int(math.floor(y / size)))
+            cell = grid[key]
+            cell[0] -= 1
+            if not cell[0]:
+                del grid[key]
+            else:
+                cell[1] -= x
+                cell[2] -= y
+                cell[3][rgb] -= 1
+                if not cell[3][rgb]:
+                    del cell[3][rgb]
+            size *= 2
+
+    def update(self, item):
+        self.add(item)
+
+    def cells(self, level, rect):
+        """
+        Non empty cells touching the rect, padded by one cell as a glyph sits on its cell centroid
+        :param level: int
+        :param rect: QtCore.QRectF in scene co-ordinates
+        :return: generator of cells
+        """
+        size = self.cellSize(level)
+        grid = self._grids[level]
+        left = int(math.floor(rect.left() / size)) - 1
+        right = int(math.floor(rect.right() / size)) + 1
+        top = int(math.floor(rect.top() / size)) - 1
+        bottom = int(math.floor(rect.bottom() / size)) + 1
+        if (right - left + 1) * (bottom - top + 1) < len(grid):
+            for cx in xrange(left, right + 1):
+                for cy in xrange(top, bottom + 1):
+                    cell = grid.get((cx, cy))
+                    if cell:
+                        yield cell
+        else:
+            for (cx, cy), cell in grid.iteritems():
+                if left <= cx <= right and top <= cy <= bottom:
+                    yield cell
+
+    def paint(self, painter, rect, zoom):
+        """
+        Draws one glyph per cell with the item count in the dominant colour of the cell.  Glyphs are drawn in
+        device pixels so they keep their size at any zoom.
+        """
+        level = self.levelForZoom(zoom)
+        transform = painter.worldTransform()
+        painter.save()
+        painter.setWorldTransform(QtGui.QTransform())
+        painter.setFont(self.font)
+        for count, sumX, sumY, colours in self.cells(level, rect):
+            centre = transform.map(QtCore.QPointF(sumX / count, sumY / count))
+            rgb = max(colours, key=colours.get)
+            radius = 4.0 + 3.0 * math.log10(count)
+            painter.setPen(self.pen)
+            painter.setBrush(self.renderer.brush(rgb))
+            painter.drawEllipse(centre, radius, radius)
+            if count > 1:
+                painter.setPen(self.textPen)
+                painter.drawText(QtCore.QRectF(centre.x() - radius, centre.y() - radius, radius * 2, radius * 2),
+                                 QtCore.Qt.AlignCenter, str(count))
+        painter.restore()
+
+
+class RadarLabelLayer(QtCore.QObject):
+    """
+    Always on name labels for the dots, painted by the scene as an overlay.  Labels are placed greedily, items
+    closest to the centre first, at the first of four spots around the dot that does not overlap a label
+    already placed.  Placed labels live in a spatial hash so the overlap test only looks at neighbours.
+
+    Text layouts are cached per item and only items whose position or name changed are placed again.  Labels
+    keep their pixel size while the dots spread apart, so everything is placed again when the zoom moves into
+    another g_LABEL_ZOOM_STEP bucket or level of detail, not on every wheel step.
+    """
+    # pixels between a dot and its label
+    padding = 2.0
+
+    def __init__(self, scene):
+        super(RadarLabelLayer, self).__init__(scene)
+        self.scene = scene
+        self.enabled = True
+        self.font = QtGui.QFont()
+        self.font.setPixelSize(10)
+        self.pen = QtGui.QPen(QtGui.QColor.fromRgb(220, 220, 220, 200))
+        self._zoom = 1.0
+        self._zoomBucket = self.zoomBucket(1.0)
+        self._texts = {}
+        self._placed = {}
+        self._hash = {}
+        self._cellSize = 32.0
+        self._dirty = set()
+        self._fullLayout = True
+        # coalesce the flood of position changes from a drag into one placement pass
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(30)
+        self._timer.timeout.connect(self.flush)
+
+    def setEnabled(self, state):
+        self.enabled = state
+        if state:
+            self.invalidate()
+        self.scene.update()
+
+    @staticmethod
+    def zoomBucket(zoom):
+        lod = bisect.bisect([g_LOD_POINT, g_LOD_DETAIL], zoom)
+        return lod, int(math.floor(math.log(max(zoom, 1e-6), g_LABEL_ZOOM_STEP)))
+
+    def setZoom(self, zoom):
+        bucket = self.zoomBucket(zoom)
+        if bucket != self._zoomBucket:
+            self._zoomBucket = bucket
+            self._zoom = zoom
+            self.invalidate()
+
+    def invalidate(self):
+        self._fullLayout = True
+        self._schedule()
+
+    def clear(self):
+        self._timer.stop()
+        self._texts = {}
+        self._placed = {}
+        self._hash = {}
+        self._dirty = set()
+
+    def add(self, item):
+        self.markDirty(item)
+
+    def markDirty(self, item):
+        self._dirty.add(item)
+        self._schedule()
+
+    def remove(self, item):
+        rect = self._unplace(item)
+        self._texts.pop(item, None)
+        self._dirty.discard(item)
+        if rect is not None:
+            self.scene.update(rect)
+
+    def _schedule(self):
+        if self.enabled and not self._timer.isActive():
+            self._timer.start()
+
+    def _text(self, item):
+        name = item.label()
+        entry = self._texts.get(item)
+        if entry is None or entry[0] != name:
+            text = QtGui.QStaticText(name)
+            text.prepare(QtGui.QTransform(), self.font)
+            size = text.size()
+            entry = self._texts[item] = (name, text, size.width(), size.height())
+        return entry
+
+    def _cells(self, rect):
+        size = self._cellSize
+        for cx in xrange(int(math.floor(rect.left() / size)), int(math.floor(rect.right() / size)) + 1):
+            for cy in xrange(int(math.floor(rect.top() / size)), int(math.floor(rect.bottom() / size)) + 1):
+                yield cx, cy
+
+    def _collides(self, rect):
+        placed = self._placed
+        for key in self._cells(rect):
+            for other in self._hash.get(key, ()):
+                if placed[other].intersects(rect):
+                    return True
+        return False
+
+    def _place(self, item):
+        if self.scene.isFilteredOut(item):
+            return None
+        name, text, width, height = self._text(item)
+        if not name:
+            return None
+        # labels keep their pixel size, so their size in the scene shrinks as we zoom in
+        scale = 1.0 / self._zoom
+        width *= scale
+        height *= scale
+        gap = item.renderer.diameters[RadarDotRenderer.NORMAL] / 2.0 + self.padding * scale
+        pos = item.scenePos()
+        x, y = pos.x(), pos.y()
+        for dx, dy in ((gap, -height / 2), (-gap - width, -height / 2), (-width / 2, -gap - height), (-width / 2, gap)):
+            rect = QtCore.QRectF(x + dx, y + dy, width, height)
+            if not self._collides(rect):
+                self._placed[item] = rect
+                for key in self._cells(rect):
+                    self._hash.setdefault(key, set()).add(item)
+                return rect
+        return None
+
+    def _unplace(self, item):
+        rect = self._placed.pop(item, None)
+        if rect is not None:
+            for key in self._cells(rect):
+                cell = self._hash.get(key)
+                if cell is not None:
+                    cell.discard(item)
+                    if not cell:
+                        del self._hash[key]
+        return rect
+
+    @staticmethod
+    def _priority(item):
+        pos = item.scenePos()
+        return pos.x() * pos.x() + pos.y() * pos.y()
+
+    def flush(self):
+        """
+        Places the labels of the dirty items, or every label after a zoom change, and repaints what moved
+        :return: None
+        """
+        if not self.enabled:
+            return
+        if self._fullLayout:
+            self._fullLayout = False
+            self._dirty = set()
+            self._placed = {}
+            self._hash = {}
+            self._cellSize = max(self.font.pixelSize() * 3.0 / self._zoom, 1.0)
+            for item in sorted(self.scene.radarItems(), key=self._priority):
+                self._place(item)
+            self.scene.update()
+            return
+
+        changed = QtCore.QRectF()
+        dirty = sorted(self._dirty, key=self._priority)
+        self._dirty = set()
+        for item in dirty:
+            old = self._unplace(item)
+            if old is not None:
+                changed = changed.united(old)
+            if item.scene() is self.scene:
+                new = self._place(item)
+                if new is not None:
+                    changed = changed.united(new)
+        if not changed.isNull():
+            self.scene.update(changed)
+
+    def paint(self, painter, rect):
+        """
+        Draws the placed labels touching the exposed rect.  Text is drawn in device pixels from the cached
+        layouts, nothing is measured or placed here.
+        """
+        if not self.enabled or not self._placed:
+            return
+        transform = painter.worldTransform()
+        painter.save()
+        painter.setWorldTransform(QtGui.QTransform())
+        painter.setPen(self.pen)
+        painter.setFont(self.font)
+        drawn = set()
+        for key in self._cells(rect):
+            for item in self._hash.get(key, ()):
+                if item in drawn:
+                    continue
+                drawn.add(item)
+                if not item.isVisible():
+                    continue
+                # renames are re-placed from updateRadarItem, this draws the cached layout as it is
+                text = self._texts[item][1]
+                painter.drawStaticText(transform.map(self._placed[item].topLeft()), text)
+        painter.restore()
+
+
+class RadarDragStream(QtCore.QObject):
+    """
+    Optional live drag channel.  While the user drags, the latest positions are sampled on a timer and published
+    to the db handle's drag channel rather than written to the items, and the drags of other users are polled
+    and drawn as ghost rings.  The durable write still happens once on release.
+
+    Every client publishing on a board slows down as more users drag, so together they stay within
+    g_DRAG_SCENE_WRITES writes a second.
+    """
+    ghostRadius = 9.0
+
+    def __init__(self, scene):
+        super(RadarDragStream, self).__init__(scene)
+        self.scene = scene
+        self.enabled = False
+        self.pen = QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255, 160), 1, QtCore.Qt.DashLine)
+        self.textPen = QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255, 160))
+        self.font = QtGui.QFont()
+        self.font.setPixelSize(9)
+        self._pending = {}
+        self._published = False
+        self._ghosts = {}
+        self._otherUsers = set()
+        self._publishTimer = QtCore.QTimer(self)
+        self._publishTimer.setSingleShot(True)
+        self._publishTimer.timeout.connect(self.publish)
+        self._pollTimer = QtCore.QTimer(self)
+        self._pollTimer.setInterval(g_DRAG_POLL_MS)
+        self._pollTimer.timeout.connect(self.poll)
+
+    def setEnabled(self, state):
+        if state == self.enabled:
+            return
+        self.enabled = state
+        if state:
+            self._pollTimer.start()
+        else:
+            self._pollTimer.stop()
+            self.finish()
+            self.setGhosts({})
+
+    def publishInterval(self):
+        """
+        :return: int, milliseconds between samples for this client
+        """
+        users = len(self._otherUsers) + 1
+        return int(max(1000.0 / g_DRAG_SAMPLE_HZ, 1000.0 * users / g_DRAG_SCENE_WRITES))
+
+    def itemMoved(self, item):
+        record = item.record
+        if not self.enabled or record is None:
+            return
+        pos = item.scenePos()
+        self._pending[record._id] = (pos.x(), pos.y())
+        if not self._publishTimer.isActive():
+            self._publishTimer.start(self.publishInterval())
+
+    def publish(self):
+        if not self._pending or self.scene.mongoSceneHandle is None:
+            return
+        positions = [(itemId, x, y) for itemId, (x, y) in self._pending.iteritems()]
+        self._pending = {}
+        self.scene.mongoSceneHandle.publishDragPositions(positions)
+        self._published = True
+
+    def finish(self):
+        """
+        Called when the drag ends, the ghosts other users see are removed
+        """
+        self._publishTimer.stop()
+        self._pending = {}
+        if self._published and self.scene.mongoSceneHandle is not None:
+            self.scene.mongoSceneHandle.clearDragPositions()
+        self._published = False
+
+    def poll(self):
+        if self.scene.isSuspended() or self.scene.mongoSceneHandle is None:
+            return
+        ghosts = {}
+        users = set()
+        for doc in self.scene.mongoSceneHandle.dragPositions():
+            ghosts[str(doc["item_id"])] = (doc["pos"][0], doc["pos"][1], doc["user"])
+            users.add(doc["user"])
+        self._otherUsers = users
+        self.setGhosts(ghosts)
+
+    def ghostRect(self, ghost):
+        # generous so the user name drawn at the ring's side is included at any zoom
+        size = self.ghostRadius * 12
+        return QtCore.QRectF(ghost[0] - size, ghost[1] - size, size * 2, size * 2)
+
+    def setGhosts(self, ghosts):
+        if ghosts == self._ghosts:
+            return
+        changed = QtCore.QRectF()
+        for ghost in self._ghosts.itervalues():
+            changed = changed.united(self.ghostRect(ghost))
+        for ghost in ghosts.itervalues():
+            changed = changed.united(self.ghostRect(ghost))
+        self._ghosts = ghosts
+        self.scene.update(changed)
+
+    def paint(self, painter, rect):
+        if not self._ghosts:
+            return
+        transform = painter.worldTransform()
+        painter.save()
+        painter.setWorldTransform(QtGui.QTransform())
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.setFont(self.font)
+        radius = self.ghostRadius
+        for x, y, user in self._ghosts.itervalues():
+            centre = transform.map(QtCore.QPointF(x, y))
+            painter.setPen(self.pen)
+            painter.drawEllipse(centre, radius, radius)
+            painter.setPen(self.textPen)
+            painter.drawText(centre + QtCore.QPointF(radius + 2, 3), user)
+        painter.restore()
+
+
+class RadarHeatmapLayer(QtCore.QObject):
+    """
+    Item density over the radar, painted under the dots.  The grid is binned and blurred with NumPy from the
+    model's columnar store into a small image.  It follows the model's change signals, which fire once an edit
+    reaches the store, and is recomputed a short while after they stop rather than on every change.
+
+    Items are counted once each.  The count can be filtered to the items with some tags, the list's tag
+    filter, or with one colour.
+    """
+    resolution = 256
+    blurRadius = 3
+    opacity = 0.7
+
+    def __init__(self, scene):
+        super(RadarHeatmapLayer, self).__init__(scene)
+        self.scene = scene
+        self.enabled = False
+        self.filterTags = None
+        self.filterRgb = None
+        self._ramp = heatRamp()
+        self._image = None
+        self._timer = QtCore.QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(250)
+        self._timer.timeout.connect(self.recompute)
+
+    def setEnabled(self, state):
+        if state == self.enabled:
+            return
+        self.enabled = state
+        if state:
+            self.recompute()
+        else:
+            self._timer.stop()
+            self._image = None
+            self.scene.update(self.scene.radarRect())
+
+    def setFilter(self, tags=None, rgb=None):
+        """
+        :param tags: optional list of str, only count items with any of the tags
+        :param rgb: optional packed 0xRRGGBB, only count items of this colour
+        :return: None
+        """
+        if tags != self.filterTags or rgb != self.filterRgb:
+            self.filterTags = tags
+            self.filterRgb = rgb
+            self.schedule()
+
+    def connectModel(self, model):
+        model.radarItemChanged.connect(self.schedule)
+        model.radarItemsChanged.connect(self.schedule)
+        model.radarItemInserted.connect(self.schedule)
+        model.radarItemRemoved.connect(self.schedule)
+        model.radarItemsRemoved.connect(self.schedule)
+
+    def schedule(self, *args):
+        if self.enabled and not self._timer.isActive():
+            self._timer.start()
+
+    def stop(self):
+        self._timer.stop()
+
+    def recompute(self):
+        model = self.scene.sourceModel
+        if not self.enabled or model is None:
+            return
+        store = model.store
+        mask = None
+        if self.filterTags:
+            mask = store.tagsMask(self.filterTags)
+        if self.filterRgb is not None:
+            colourMask = store.colours == self.filterRgb
+            mask = colourMask if mask is None else mask & colourMask
+        rect = self.scene.radarRect()
+        size = self.resolution
+        grid = store.densityGrid(rect.x(), rect.y(), rect.width(), rect.height(), size, mask=mask)
+        pixels = heatmapPixels(blurGrid(grid, self.blurRadius), self._ramp)
+        # copy so the image owns its pixels once the array goes
+        self._image = QtGui.QImage(pixels.tostring(), size, size, QtGui.QImage.Format_ARGB32).copy()
+        self.scene.update(rect)
+
+    def paint(self, painter, exposed):
+        """
+        Draws the part of the heatmap under the exposed rect, scaled up with smoothing
+        """
+        if not self.enabled or self._image is None:
+            return
+        rect = self.scene.radarRect()
+        exposed = exposed.intersected(rect)
+        if exposed.isEmpty():
+            return
+        ratio = self._image.width() / rect.width()
+        source = QtCore.QRectF((exposed.x() - rect.x()) * ratio, (exposed.y() - rect.y()) * ratio,
+                               exposed.width() * ratio, exposed.height() * ratio)
+        painter.save()
+        painter.setOpacity(self.opacity)
+        painter.setRenderHint(QtGui.QPainter.SmoothPixmapTransform)
+        painter.drawImage(exposed, self._image, source)
+        painter.restore()
+
+
 class RadarGraphicsScene(QtGui.QGraphicsScene):
     """
     Reimplemented to access the public methods to do my own thing.
     """
+    # how items rejected by the list filters are shown
+    HIDE_FILTERED = 0
+    DIM_FILTERED = 1
+    dimmedOpacity = 0.15
+
     sceneDoubleClicked = Signal(QtCore.QPointF)
     radarItemClicked = Signal(RadarGraphicsItem)
     radarItemAdded = Signal(RadarGraphicsItem)
     radarItemMoved = Signal(RadarGraphicsItem)
+    populateProgress = Signal(int, int)
+    populateFinished = Signal()
+    # ids of dots that moved, changed colour, appeared or went, batched for the overview
+    radarItemsDirty = Signal(list)
 
     def __init__(self,*args, **kwargs):
         super(RadarGraphicsScene, self).__init__(*args, **kwargs)
         self.mongoSceneHandle = None
         self.radarItemTableModel = None
+        self.sourceModel = None
+        self.proxyModel = None
 
         self.backgroundBrush = QtGui.QBrush(QtGui.QColor.fromRgb(34, 17, 17, 50))
         self.backgroundPenLines = QtGui.QPen(QtGui.QColor.fromRgb(0153, 38, 0, 25), 2)
         self.backgroundPenRings = QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 75), 2)
         self.backgroundPenLinesBold = QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 80), 2)
 
+        self._itemDict = {}
+        self.pulseDriver = RadarPulseDriver(self)
+        # sector swept per frame and the items currently pulsing because of it
+        self.sweepSpan = 45.0
+        self.sweepIndex = RadarSweepIndex(self.maxRadarDiameter() / 2)
+        self._sweepAngle = None
+        self._sweepActive = set()
+        self._showLabels = False
+        self._viewZoom = 1.0
+        self._clustered = False
+        self.clusterLayer = RadarClusterLayer()
+        self.labelLayer = RadarLabelLayer(self)
+        self.heatmapLayer = RadarHeatmapLayer(self)
+
+        # ids of the items the list filters reject, applied to the dots as a diff
+        self._filterRejected = set()
+        self._filterMode = self.HIDE_FILTERED
+        self._filterTimer = QtCore.QTimer(self)
+        self._filterTimer.setSingleShot(True)
+        self._filterTimer.setInterval(0)
+        self._filterTimer.timeout.connect(self.syncFilter)
+
+        self._suspended = False
+        self._overviewDirty = set()
+        self._overviewTimer = QtCore.QTimer(self)
+        self._overviewTimer.setSingleShot(True)
+        self._overviewTimer.setInterval(100)
+        self._overviewTimer.timeout.connect(self.flushOverviewDirty)
+        self._syncingSelection = False
+        # ids selected while their dots are hidden behind clusters, Qt cannot select hidden items
+        self._hiddenSelection = set()
+        self._selectionTimer = QtCore.QTimer(self)
+        self._selectionTimer.setSingleShot(True)
+        self._selectionTimer.setInterval(0)
+        self._selectionTimer.timeout.connect(self.syncSelectionToList)
+        self._dragging = False
+        self.dragStream = RadarDragStream(self)
+        self.frameGovernor = RadarFrameGovernor(self)
+        self.frameGovernor.rateChanged.connect(self.setFrameRate)
+        self._paintClock = QtCore.QElapsedTimer()
+        # repaint only the wedge the sweep moved through rather than the whole radar each frame
+        self.sweepRepaintWedge = True
+
+        self._populateQueue = []
+        self._populateCount = 0
+        self._populateTimer = QtCore.QTimer(self)
+        self._populateTimer.setInterval(0)
+        self._populateTimer.timeout.connect(self.populateStep)
+
         self.setupBackground()
         self.setupAnimatedRadar()
         self.attributeEditor = None
         self.listPanel = None
 
-        self._itemDict = {}
-
     def initScene(self, mongoSceneHandle, attribEditor, listPanel):
         """
         Setup the scene with the data form the db, builds the table model for the views to connect to.
@@ -194,38 +1222,391 @@ class RadarGraphicsScene(QtGui.QGraphicsScene):
         self.sourceModel = RadarItemsTableModel(mongoSceneHandle)
         self.proxyModel = ItemFilterProxyMode(self)
         self.proxyModel.setSourceModel(self.sourceModel)
+        self.sourceModel.radarItemChanged.connect(self.proxyModel.recordChanged)
+        self.sourceModel.radarItemsChanged.connect(self.proxyModel.recordsChanged)
         self.attributeEditor = attribEditor
         self.listPanel = listPanel
         self.attributeEditor.clearData()
         assert isinstance(self.attributeEditor, RadarAttributeEditor)
         assert isinstance(self.listPanel, RadarListPanel)
         self.listPanel.form.filter_lineEdit.textChanged.connect(self.proxyModel.setFilterRegExp)
-        self.listPanel.radarListSelectionChanged.connect(self.selectRadarItemByID)
+        self.listPanel.radarListSelectionChanged.connect(self.selectRadarItemsByID)
         self.proxyModel.setFilterKeyColumn(self.sourceModel.columns.index("name"))
+        # any change to the proxy rows may change what is filtered, they all fold into one sync
+        self.proxyModel.modelReset.connect(self.scheduleFilterSync)
+        self.proxyModel.layoutChanged.connect(self.scheduleFilterSync)
+        self.proxyModel.rowsInserted.connect(self.scheduleFilterSync)
+        self.proxyModel.rowsRemoved.connect(self.scheduleFilterSync)
+        # so do edits to the fields the filter reads, moves, renames, tag edits and remote changes
+        self.sourceModel.dataChanged.connect(self.scheduleFilterSync)
+        self.sourceModel.radarItemChanged.connect(self.scheduleFilterSync)
+        self.sourceModel.radarItemsChanged.connect(self.scheduleFilterSync)
+        self.sourceModel.radarItemChanged.connect(self.updateRadarItem)
+        # selection made on the dots is pushed to the list once per event loop pass, however many changed
+        self.selectionChanged.connect(self.scheduleSelectionSync)
+        self.sourceModel.radarItemsChanged.connect(self.updateRadarItems)
+        self.sourceModel.radarItemInserted.connect(self.insertRadarItem)
+        self.sourceModel.radarItemRemoved.connect(self.removeRadarItem)
+        self.sourceModel.radarItemsRemoved.connect(self.removeRadarItems)
+        # the heatmap bins the store, which only changes once an edit reaches the model
+        self.heatmapLayer.connectModel(self.sourceModel)
+        self.populate(self.sourceModel.datatable)
+
+    def populate(self, records):
+        """
+        Adds the graphics items for the records in slices from the event loop, so the tab is up straight away
+        and the dots closest to the centre show first.  The scene index is off until the last item is in.
+        The records are shared with the model rather than fetched again.
+        :param records: list of RadarItemRecord
+        :return: None
+        """
+        self._populateQueue = sorted(records, key=lambda record: record.distance or 0.0, reverse=True)
+        self._populateCount = len(self._populateQueue)
+        if not self._populateQueue:
+            self.populateFinished.emit()
+            return
+        self.setItemIndexMethod(QtGui.QGraphicsScene.NoIndex)
+        self.populateStep()
+        if self._populateQueue:
+            self._populateTimer.start()
+
+    def isPopulating(self):
+        return bool(self._populateQueue)
+
+    def populateStep(self):
+        queue = self._populateQueue
+        timer = QtCore.QElapsedTimer()
+        timer.start()
+        while queue and timer.elapsed() < g_POPULATE_SLICE_MS:
+            # the queue is sorted furthest first so the closest items pop off the end
+            store = self.sourceModel.store
+            for record in queue[-256:][::-1]:
+                # skip records removed by a refresh before their turn came
+                if record._id in store:
+                    self.createRadarItem(record)
+            del queue[-256:]
+
+        total = self._populateCount
+        self.populateProgress.emit(total - len(queue), total)
+        if not queue:
+            self.stopPopulate()
+            self.populateFinished.emit()
+
+    def stopPopulate(self):
+        self._populateTimer.stop()
+        self._populateQueue = []
+        self.setItemIndexMethod(QtGui.QGraphicsScene.BspTreeIndex)
+
+    def createRadarItem(self, record):
+        graphicsItem = RadarGraphicsItem()
+        graphicsItem.setId(record._id)
+        graphicsItem.setPos(record.x, record.y)
+        graphicsItem.setColour(QtGui.QColor.fromRgb(record.colour))
+        graphicsItem.setLocked(self.isLockedByOther(record))
+        self.addItem(graphicsItem)
+        return graphicsItem
+
+    @staticmethod
+    def isLockedByOther(record):
+        return bool(record.locked_by) and record.locked_by != getpass.getuser()
+
+    def updateRadarItem(self, idx, field):
+        """
+        Single entry point for model changes to reach the graphics items.  The item is found through the id
+        lookup so a change costs one call whatever the size of the board.
+        :param idx: str
+        :param field: str, the record field that changed
+        :return: None
+        """
+        item = self._itemDict.get(idx)
+        if item is None or item.record is None:
+            return
+        record = item.record
+        if field == "colour":
+            item.setColour(QtGui.QColor.fromRgb(record.colour))
+            item.update()
+        elif field == "name":
+            self.labelLayer.markDirty(item)
+            item.update()
+        elif field == "pos":
+            # local drags have already moved the item, this only moves it for remote edits
+            if item.pos() != QtCore.QPointF(record.x, record.y):
+                item.setPos(record.x, record.y)
+                item.cachePosition()
+        elif field in ("locked", "locked_by"):
+            item.setLocked(self.isLockedByOther(record))
+            item.update()
+
+    def updateRadarItems(self, ids, field):
+        for idx in ids:
+            self.updateRadarItem(idx, field)
+
+    def insertRadarItem(self, idx):
+        if idx not in self._itemDict:
+            self.createRadarItem(self.sourceModel.rawDataFromId(idx))
+
+    def removeRadarItem(self, idx):
+        item = self._itemDict.get(idx)
+        if item is not None:
+            self.removeItem(item)
+
+    def removeRadarItems(self, ids):
+        for idx in ids:
+            self.removeRadarItem(idx)
+        if self.attributeEditor and self.attributeEditor.radarItem is not None and \
+                self.attributeEditor.radarItem.id() in ids:
+            self.attributeEditor.clearData()
+
+    def refresh(self):
+        if self.sourceModel:
+            self.sourceModel.refresh()
+
+    def dialogParent(self):
+        views = self.views()
+        if views:
+            return views[0]
+
+    def contextMenuEvent(self, event):
+        """
+        Bulk edits for the selected items.  Each action is a single write whatever the size of the selection.
+        """
+        item = self.itemAt(event.scenePos())
+        if getattr(item, "id", "") and not item.isSelected():
+            self.setSelectedIds([item.id()])
+        ids = [i.id() for i in self.selectedRadarItems()]
+        if not ids or self.sourceModel is None:
+            return super(RadarGraphicsScene, self).contextMenuEvent(event)
+
+        menu = QtGui.QMenu()
+        title = menu.addAction("{0} item{1}".format(len(ids), "s" if len(ids) > 1 else ""))
+        title.setEnabled(False)
+        menu.addSeparator()
+        colourAct = menu.addAction("Set Colour...")
+        addTagAct = menu.addAction("Add Tag...")
+        removeTagAct = menu.addAction("Remove Tag...")
+        linkAct = menu.addAction("Set Link...")
+        menu.addSeparator()
+        deleteAct = menu.addAction("Delete")
+        action = menu.exec_(event.screenPos())
+        parent = self.dialogParent()
+        model = self.sourceModel
+
+        if action is colourAct:
+            colour = QtGui.QColorDialog.getColor(QtGui.QColor.fromRgb(self._itemDict[ids[0]].rgb()), parent)
+            if colour.isValid():
+                model.setColours(ids, colour)
+        elif action in (addTagAct, removeTagAct):
+            label = "Add Tag" if action is addTagAct else "Remove Tag"
+            text, state = QtGui.QInputDialog.getText(parent, label, "Tags, comma separated:")
+            tags = [t.strip() for t in text.split(",") if t.strip()]
+            if state and tags:
+                if action is addTagAct:
+                    model.addTags(ids, tags)
+                else:
+                    model.removeTags(ids, tags)
+        elif action is linkAct:
+            text, state = QtGui.QInputDialog.getText(parent, "Set Link", "Link:")
+            if state:
+                model.setLinks(ids, text)
+        elif action is deleteAct:
+            result = QtGui.QMessageBox.warning(parent, "Delete Items",
+                                               "Are you sure you want to delete {0} items".format(len(ids)),
+                                               QtGui.QMessageBox.Ok, QtGui.QMessageBox.Cancel)
+            if result == QtGui.QMessageBox.Ok:
+                model.deleteItems(ids)
+        event.accept()
+
+    def keyPressEvent(self, event):
+        """
+        Arrow keys nudge the selected items, a pixel at a time or ten with shift
+        """
+        offsets = {QtCore.Qt.Key_Left: (-1, 0), QtCore.Qt.Key_Right: (1, 0),
+                   QtCore.Qt.Key_Up: (0, -1), QtCore.Qt.Key_Down: (0, 1)}
+        offset = offsets.get(event.key())
+        items = self.selectedRadarItems()
+        if offset is None or not items or self.sourceModel is None:
+            return super(RadarGraphicsScene, self).keyPressEvent(event)
+        step = 10 if event.modifiers() & QtCore.Qt.ShiftModifier else 1
+        self.sourceModel.moveBy([i.id() for i in items if not i.isLocked()], offset[0] * step, offset[1] * step)
+        event.accept()
+
+    def scheduleFilterSync(self, *args):
+        if not self._filterTimer.isActive():
+            self._filterTimer.start()
+
+    def syncFilter(self):
+        """
+        Mirrors the proxy's filter onto the dots, evaluated in one vectorized pass over the model's store.  Only
+        the items whose state differs from the last sync are touched, Qt folds their repaints into the next frame.
+        :return: None
+        """
+        proxy = self.proxyModel
+        if proxy is None:
+            return
+        rejected = set()
+        if proxy.isFiltering():
+            # the proxy's criteria evaluated over the columnar store rather than walking its rows
+            store = self.sourceModel.store
+            accepted = store.filterMask(proxy.tags, proxy.zones, proxy.filterRegExp().pattern())
+            rejected = set(store.idsFromMask(~accepted))
+
+        # the heatmap follows the list's tag filter
+        self.heatmapLayer.setFilter(sorted(proxy.tags) or None, self.heatmapLayer.filterRgb)
+
+        previous = self._filterRejected
+        self._filterRejected = rejected
+        for idx in rejected - previous:
+            item = self._itemDict.get(idx)
+            if item is not None:
+                self.clusterLayer.remove(item)
+                self.applyFilterState(item)
+        for idx in previous - rejected:
+            item = self._itemDict.get(idx)
+            if item is not None:
+                self.clusterLayer.add(item)
+                self.applyFilterState(item)
+        if self._clustered and rejected != previous:
+            self.update()
+
+    def isFilteredOut(self, item):
+        return item.id() in self._filterRejected
 
-        # Add all the items to the scene
-        for i in self.mongoSceneHandle.items():
-            graphicsItem = RadarGraphicsItem()
-            graphicsItem.setId(i["_id"])
-            graphicsItem.setPos(i["pos"][0], i["pos"][1])
-            graphicsItem.setColour(QtGui.QColor(*i["colour"]))
-            graphicsItem.record = i
-            self.addItem(graphicsItem)
-            self.sourceModel.updateGraphicsItemColour.connect(graphicsItem.updateColour)
+    def setFilterMode(self, mode):
+        """
+        :param mode: HIDE_FILTERED or DIM_FILTERED
+        :return: None
+        """
+        if mode != self._filterMode:
+            self._filterMode = mode
+            for idx in self._filterRejected:
+                item = self._itemDict.get(idx)
+                if item is not None:
+                    self.applyFilterState(item)
+
+    def applyFilterState(self, item):
+        filtered = self.isFilteredOut(item)
+        item.setOpacity(self.dimmedOpacity if filtered and self._filterMode == self.DIM_FILTERED else 1.0)
+        self.updateItemVisibility(item)
+        self.labelLayer.markDirty(item)
+        self.markOverviewDirty(item)
+
+    def isHiddenByFilter(self, item):
+        return self._filterMode == self.HIDE_FILTERED and self.isFilteredOut(item)
+
+    def markOverviewDirty(self, item):
+        self._overviewDirty.add(item.id())
+        if not self._overviewTimer.isActive():
+            self._overviewTimer.start()
+
+    def flushOverviewDirty(self):
+        dirty = list(self._overviewDirty)
+        self._overviewDirty = set()
+        if dirty:
+            self.radarItemsDirty.emit(dirty)
 
 
     def addItem(self, item):
         idx = getattr(item, 'id', '')
+        result = super(RadarGraphicsScene, self).addItem(item)
         if idx:
             self._itemDict[str(idx())] = item
-        return super(RadarGraphicsScene, self).addItem(item)
+            self.sweepIndex.add(item)
+            if not self.isFilteredOut(item):
+                self.clusterLayer.add(item)
+            self.labelLayer.add(item)
+            item.setShowLabel(self._showLabels)
+            self.applyFilterState(item)
+        return result
 
     def removeItem(self, item):
         idx = getattr(item, 'id', '')
         if idx:
             self._itemDict.pop(str(idx()), None)
+            self.sweepIndex.remove(item)
+            self.clusterLayer.remove(item)
+            self.labelLayer.remove(item)
+            self._sweepActive.discard(item)
+            self.markOverviewDirty(item)
+            item.stop()
         super(RadarGraphicsScene, self).removeItem(item)
 
+    def setViewZoom(self, zoom):
+        """
+        The view tells the scene its zoom so the dots can switch their labels on when they are readable
+        :param zoom: float
+        :return: None
+        """
+        self._viewZoom = zoom
+        self.labelLayer.setZoom(zoom)
+        self.updateItemLabels()
+
+        # switching clusters on hides every dot so Qt no longer paints them, this only happens on the crossing
+        clustered = zoom < g_CLUSTER_ZOOM
+        if clustered != self._clustered:
+            self._clustered = clustered
+            self._syncingSelection = True
+            try:
+                for item in self._itemDict.itervalues():
+                    self.updateItemVisibility(item)
+            finally:
+                self._syncingSelection = False
+            if not clustered:
+                # whatever is still hidden is hidden by the filter and drops out of the selection
+                self._hiddenSelection = set()
+        self.update()
+
+    def updateItemLabels(self):
+        # with the label layer on the dots never paint their own names
+        showLabels = self._viewZoom >= g_LOD_DETAIL and not self.labelLayer.enabled
+        if showLabels != self._showLabels:
+            self._showLabels = showLabels
+            for item in self._itemDict.itervalues():
+                item.setShowLabel(showLabels)
+
+    def setLabelsEnabled(self, state):
+        self.labelLayer.setEnabled(state)
+        self.updateItemLabels()
+
+    def radarItems(self):
+        return self._itemDict.values()
+
+    def updateItemVisibility(self, item):
+        visible = not self._clustered and not self.isHiddenByFilter(item)
+        if visible == item.isVisible():
+            return
+        # hiding deselects, the selection is held by id while the dot is behind a cluster
+        if not visible and item.isSelected() and not self.isHiddenByFilter(item):
+            self._hiddenSelection.add(item.id())
+        item.setVisible(visible)
+        if visible and item.id() in self._hiddenSelection:
+            self._hiddenSelection.discard(item.id())
+            item.setSelected(True)
+
+    def radarItemPositionChanged(self, item):
+        """
+        Called by the radar items whenever they move so the spatial indexes stay current
+        :param item: RadarGraphicsItem
+        :return: None
+        """
+        if self._itemDict.get(item.id()) is item:
+            self.sweepIndex.update(item)
+            if not self.isFilteredOut(item):
+                self.clusterLayer.update(item)
+            self.labelLayer.markDirty(item)
+            self.markOverviewDirty(item)
+            if self._dragging:
+                self.dragStream.itemMoved(item)
+            if self._clustered:
+                self.update()
+
+    def radarItemColourChanged(self, item):
+        if self._itemDict.get(item.id()) is item:
+            self.markOverviewDirty(item)
+        if self._itemDict.get(item.id()) is item and not self.isFilteredOut(item):
+            self.clusterLayer.update(item)
+            if self._clustered:
+                self.update()
+
     def setActive(self):
         if self.attributeEditor:
             self.attributeEditor.setGraphicsScene(self)
@@ -238,16 +1619,28 @@ class RadarGraphicsScene(QtGui.QGraphicsScene):
             return self.proxyModel.mapFromSource(index)
 
     def radarItemToSourceIndex(self, item, columnName='name'):
-        rowData = self.sourceModel.rowModelIndexFromId(item.id())
-        if rowData:
-            return rowData[columnName]
+        index = self.sourceModel.indexFromId(item.id(), columnName)
+        if index.isValid():
+            return index
 
     def radarItemToSourceRowIndexData(self, item):
-        return self.sourceModel.rowModelIndexFromId(item.id())
+        model = self.sourceModel
+        row = model.rowFromId(item.id())
+        if row == -1:
+            return {}
+        return dict((name, model.index(row, column)) for column, name in enumerate(model.columns))
 
-    def updateItemRecord(self, item):
-        record = self.sourceModel.rawDataFromId(item.id())
-        item.record = record
+    def recordFromId(self, idx):
+        """
+        :param idx: str
+        :return: RadarItemRecord or None
+        """
+        if self.sourceModel is None:
+            return None
+        row = self.sourceModel.rowFromId(idx)
+        if row == -1:
+            return None
+        return self.sourceModel.rawDataFromRow(row)
 
     def selectRadarItemByID(self, scene, idx):
         """
@@ -256,103 +1649,395 @@ class RadarGraphicsScene(QtGui.QGraphicsScene):
         :param idx: str
         :return: None
         """
-        # Grab the View from the current Tab and thus dig down into the scene graph.
-        # The the method to extract the radarItem.
+        self.selectRadarItemsByID(scene, [idx])
 
+    def selectRadarItemsByID(self, scene, ids):
+        """
+        Slot for the list panel, the list is not told about a selection it made itself
+        :param scene: RadarGraphicsScene, ignored unless it is this scene
+        :param ids: list of str
+        :return: None
+        """
         if scene is self:
-            log.debug("Select Radar Item by ID")
-            item = self.itemFromID(idx)
-            log.debug("Found GraphicsItem in Radar : {0}".format(item))
-            if item:
-                # It was difficult to find out the best way to select items in the scene.  This is like drawing
-                # a box selection on the viewport and the contained items are selected.
-                self.clearSelection()
-                painterPath = QtGui.QPainterPath()
-                painterPath.addRect(item.boundingRect())
-                painterPath.translate(item.scenePos())
-                self.attributeEditor.setRadarItem(item)
-                self.setSelectionArea(painterPath, QtGui.QTransform())
+            self.setSelectedIds(ids, notifyList=False)
+
+    def setSelectedIds(self, ids, add=False, notifyList=True):
+        """
+        Makes the selected dots match the ids.  Items are looked up by id and only the ones whose state
+        changes are touched.  Dots hidden behind clusters are selected by id and pick the selection up when
+        they are shown again.
+        :param ids: list of str
+        :param add: bool, keep the current selection and add the ids to it
+        :param notifyList: bool, push the new selection to the list panel
+        :return: None
+        """
+        log.debug("Select Radar Items by ID : {0}".format(len(ids)))
+        items = [self._itemDict[idx] for idx in ids if idx in self._itemDict]
+        wanted = set(item for item in items if item.isVisible())
+        hidden = set(item.id() for item in items if not item.isVisible())
+        current = set(self.selectedItems())
+        if add:
+            wanted |= current
+            hidden |= self._hiddenSelection
+        self._hiddenSelection = hidden
+        self._syncingSelection = True
+        try:
+            for item in current - wanted:
+                item.setSelected(False)
+            for item in wanted - current:
+                item.setSelected(True)
+        finally:
+            self._syncingSelection = False
+        self._selectionTimer.stop()
+        if notifyList:
+            self.syncSelectionToList()
+        selected = self.selectedRadarItems()
+        if len(selected) == 1 and self.attributeEditor:
+            self.attributeEditor.setRadarItem(selected[0])
+
+    def selectableIds(self, ids):
+        # dots hidden by the filters are left out, dimmed ones can still be picked
+        if self._filterMode == self.HIDE_FILTERED and self._filterRejected:
+            return [idx for idx in ids if idx not in self._filterRejected]
+        return ids
+
+    def radarItemIdsInRect(self, rect):
+        """
+        Area query on the model's columnar store, dots only and without touching the scene index
+        :param rect: QtCore.QRectF, scene coordinates
+        :return: list of str ids
+        """
+        if self.sourceModel is None:
+            return []
+        rect = rect.normalized()
+        return self.selectableIds(self.sourceModel.store.selectRect(rect.left(), rect.top(), rect.right(),
+                                                                    rect.bottom()))
+
+    def radarItemIdsInPolygon(self, polygon):
+        """
+        :param polygon: QtGui.QPolygonF, scene coordinates
+        :return: list of str ids
+        """
+        if self.sourceModel is None:
+            return []
+        points = [(polygon[i].x(), polygon[i].y()) for i in xrange(polygon.count())]
+        return self.selectableIds(self.sourceModel.store.selectPolygon(points))
+
+    def selectedRadarItems(self):
+        items = [i for i in self.selectedItems() if getattr(i, "id", "")]
+        items.extend(self._itemDict[idx] for idx in self._hiddenSelection if idx in self._itemDict)
+        return items
+
+    def scheduleSelectionSync(self):
+        if not self._syncingSelection and not self._selectionTimer.isActive():
+            self._selectionTimer.start()
+
+    def syncSelectionToList(self):
+        if self.listPanel and self.listPanel.scene is self:
+            self.listPanel.selectRadarItems(self, self.selectedRadarItems())
 
     def maxRadarDiameter(self):
         return self.width() + self.height() / 2
 
+    def radarRect(self):
+        """
+        Scene rect covered by the radar rings, with room for the ring pen
+        :return: QtCore.QRectF
+        """
+        diameter = self.maxRadarDiameter()
+        margin = self.backgroundPenRings.widthF()
+        return QtCore.QRectF(-diameter / 2 - margin, -diameter / 2 - margin, diameter + margin * 2, diameter + margin * 2)
+
     def setupBackground(self):
         """
-        I was so tempted to just download a nice picture but in the end I manually drew the radar on the canvas
+        I was so tempted to just download a nice picture but in the end I manually drew the radar on the canvas.
+        The rings and grid are painted into a cached pixmap by drawBackground rather than added as scene items,
+        so they never show up in items(), hit tests or the scene index.
+        :return: None
+        """
+        self._backgroundPixmap = None
+        self._backgroundKey = None
+        self.sceneRectChanged.connect(self.invalidateBackgroundCache)
+
+    def invalidateBackgroundCache(self, *args):
+        self._backgroundPixmap = None
+        self._backgroundKey = None
+        self.sweepIndex.radius = self.maxRadarDiameter() / 2
+        self.update()
+
+    def paintRadarBackground(self, painter):
+        """
+        Paints the radar rings and grid in scene co-ordinates
+        :param painter: QtGui.QPainter
         :return: None
         """
-        backgroundBrush = self.backgroundBrush
-        backgroundPenLines = self.backgroundPenLines
-        backgroundPenRings = self.backgroundPenRings
         diameter = self.maxRadarDiameter()
-        topY = diameter / 2 * -1
         topX = diameter / 2 * -1
         bottomX = topX * -1
-        bottomY = topY * -1
-        ringCount = 10
+        ringCount = g_RING_COUNT
         ringOffset = diameter / ringCount
         screenPosX = (diameter / 2) * -1
         screenPosY = (diameter / 2) * -1
         numberOfLines = ringCount * 2
 
         # draw the radar circles
+        painter.setPen(self.backgroundPenRings)
+        painter.setBrush(self.backgroundBrush)
         for i in range(ringCount):
-            self.addEllipse(0-(diameter/2), 0-(diameter/2), diameter, diameter, backgroundPenRings, backgroundBrush)
+            painter.drawEllipse(QtCore.QRectF(0-(diameter/2), 0-(diameter/2), diameter, diameter))
             diameter -= ringOffset
 
         # overlay the grid
         for i in range(numberOfLines):
             if i not in [0, numberOfLines]:
-                l = self.addLine(screenPosX, topX, screenPosX+1, bottomX, backgroundPenLines)
-                ll = self.addLine(topX, screenPosY, bottomX, screenPosY+1, backgroundPenLines)
-
                 ## Draw the darker center lines
-                if screenPosX == 0:
-                    l.setPen(self.backgroundPenLinesBold)
-                if screenPosY == 0:
-                    ll.setPen(self.backgroundPenLinesBold)
+                painter.setPen(self.backgroundPenLinesBold if screenPosX == 0 else self.backgroundPenLines)
+                painter.drawLine(QtCore.QLineF(screenPosX, topX, screenPosX+1, bottomX))
+                painter.setPen(self.backgroundPenLinesBold if screenPosY == 0 else self.backgroundPenLines)
+                painter.drawLine(QtCore.QLineF(topX, screenPosY, bottomX, screenPosY+1))
             screenPosX += ringOffset / 2
             screenPosY += ringOffset / 2
 
-    def setupAnimatedRadar(self):
-        pen = QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 25), 2)
-        brush = QtGui.QBrush(QtGui.QColor.fromRgb(0, 150, 150, 25))
+    def backgroundPixmap(self, scale):
+        """
+        The rendered radar at the given view scale.  Scales are rounded up to quarter powers of two so small
+        zoom steps reuse the cached pixmap, and the pixmap size is capped for very deep zooms.
+        :param scale: float, view scale
+        :return: QtGui.QPixmap
+        """
+        level = int(math.ceil(math.log(max(scale, 0.01), 2) * 4))
+        radarRect = self.radarRect()
+        key = (level, radarRect.width())
+        if self._backgroundPixmap is None or self._backgroundKey != key:
+            scale = min(2 ** (level / 4.0), g_MAX_BACKGROUND_PIXELS / radarRect.width())
+            size = max(int(math.ceil(radarRect.width() * scale)), 1)
+            pixmap = QtGui.QPixmap(size, size)
+            pixmap.fill(QtCore.Qt.transparent)
+            painter = QtGui.QPainter(pixmap)
+            painter.setRenderHint(QtGui.QPainter.Antialiasing)
+            painter.scale(size / radarRect.width(), size / radarRect.height())
+            painter.translate(-radarRect.x(), -radarRect.y())
+            self.paintRadarBackground(painter)
+            painter.end()
+            self._backgroundPixmap = pixmap
+            self._backgroundKey = key
+        return self._backgroundPixmap
+
+    def drawBackground(self, painter, rect):
+        self._paintClock.start()
+        super(RadarGraphicsScene, self).drawBackground(painter, rect)
+        radarRect = self.radarRect()
+        exposed = rect.intersected(radarRect)
+        if not exposed.isEmpty():
+            transform = painter.worldTransform()
+            pixmap = self.backgroundPixmap(math.hypot(transform.m11(), transform.m12()))
+            ratio = pixmap.width() / radarRect.width()
+            source = QtCore.QRectF((exposed.x() - radarRect.x()) * ratio, (exposed.y() - radarRect.y()) * ratio,
+                                   exposed.width() * ratio, exposed.height() * ratio)
+            painter.drawPixmap(exposed, pixmap, source)
+            self.heatmapLayer.paint(painter, exposed)
+        self.drawSweep(painter)
+
+    def drawForeground(self, painter, rect):
+        super(RadarGraphicsScene, self).drawForeground(painter, rect)
+        if self._clustered:
+            self.clusterLayer.paint(painter, rect, self._viewZoom)
+        else:
+            self.labelLayer.paint(painter, rect)
+        self.dragStream.paint(painter, rect)
+        if self._paintClock.isValid():
+            self.frameGovernor.addCost(self._paintClock.nsecsElapsed())
+            self._paintClock.invalidate()
+
+    def sweepRect(self):
         rad = self.maxRadarDiameter() / 2
-        self.radarAnimItem = self.addEllipse(0-rad, 0-rad, rad*2, rad*2, pen, brush)
-        self.radarAnimItem.setPos(0,0)
-        self.radarAnimItem.setSpanAngle(360 * 2)
-        self.timeline = QtCore.QTimeLine(5000)
+        return QtCore.QRectF(0-rad, 0-rad, rad*2, rad*2)
+
+    def wedgeRect(self, start, end):
+        """
+        Bounding rect of the part of the sweep pie between two clockwise angles
+        :param start: float, degrees
+        :param end: float, degrees
+        :return: QtCore.QRectF
+        """
+        span = end - start
+        if span >= 360.0:
+            return self.sweepRect()
+        rad = self.maxRadarDiameter() / 2
+        start %= 360.0
+        xs = [0.0]
+        ys = [0.0]
+        for angle in (start, start + span):
+            xs.append(rad * math.cos(math.radians(angle)))
+            ys.append(rad * math.sin(math.radians(angle)))
+        # the pie bulges out to the radius wherever the arc crosses an axis
+        for axis in (0.0, 90.0, 180.0, 270.0, 360.0, 450.0, 540.0, 630.0):
+            if start < axis < start + span:
+                xs.append(rad * math.cos(math.radians(axis)))
+                ys.append(rad * math.sin(math.radians(axis)))
+        margin = self.sweepPen.widthF()
+        return QtCore.QRectF(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)).adjusted(
+            -margin, -margin, margin, margin)
+
+    def drawSweep(self, painter):
+        """
+        The sweep is painted with the background rather than being a scene item, so it is never returned by
+        items() or the collision queries
+        :param painter: QtGui.QPainter
+        :return: None
+        """
+        if not self._sweepVisible or self._sweepAngle is None:
+            return
+        painter.save()
+        painter.setPen(self.sweepPen)
+        painter.setBrush(self.sweepBrush)
+        # drawPie angles run counter clockwise, the sweep angle is clockwise
+        painter.drawPie(self.sweepRect(), int(-self._sweepAngle * 16), int(self.sweepSpan * 16))
+        painter.restore()
+
+    def setupAnimatedRadar(self):
+        self.sweepPen = QtGui.QPen(QtGui.QColor.fromRgb(153, 38, 0, 25), 2)
+        self.sweepBrush = QtGui.QBrush(QtGui.QColor.fromRgb(0, 150, 150, 25))
+        self._sweepVisible = True
+        self.timeline = QtCore.QTimeLine(5000, self)
         self.timeline.setEasingCurve(QtCore.QEasingCurve.Linear)
         self.timeline.setLoopCount(0)
         self.timeline.setFrameRange(0, 1)
-        self.animclip = QtGui.QGraphicsItemAnimation()
-        self.animclip.setItem(self.radarAnimItem)
-        self.animclip.setTimeLine(self.timeline)
-        self.animclip.setPosAt(0, QtCore.QPointF(0, 0))
-        self.animclip.setRotationAt(1, 360)
+        self.timeline.setUpdateInterval(self.frameGovernor.interval())
         self.timeline.start()
         self.timeline.valueChanged.connect(self.itemAnimUpdate)
 
     def itemAnimUpdate(self, f):
-        collidingItems = [i for i in self.collidingItems(self.radarAnimItem) if i in self._itemDict.values()]
-        if collidingItems:
-            i = random.choice(collidingItems)
-            i.play()
-
-        nonCollidingItems = [i for i in self._itemDict.values() if i not in collidingItems]
-        for i in nonCollidingItems:
+        """
+        Pulses the items the sweep has just reached and stops the ones its trailing edge has passed.  Only the
+        sector swept since the last frame is looked at so the cost is the number of items in that sector.
+        :param f: float, timeline value 0-1 for one revolution
+        :return: None
+        """
+        self.frameGovernor.nextFrame()
+        clock = QtCore.QElapsedTimer()
+        clock.start()
+        angle = f * 360.0
+        last = self._sweepAngle
+        self._sweepAngle = angle
+        if last is None:
+            entering = self.sweepIndex.itemsBetween(angle - self.sweepSpan, angle)
+            leaving = []
+        elif (angle - last) % 360.0 == 0.0:
+            return
+        else:
+            entering = self.sweepIndex.itemsBetween(last, angle)
+            leaving = self.sweepIndex.itemsBetween(last - self.sweepSpan, angle - self.sweepSpan)
+
+        for i in entering:
+            # hidden dots, eg while clustered, are not worth animating
+            if i.isVisible():
+                i.play()
+                self._sweepActive.add(i)
+        for i in leaving:
             i.stop()
+            self._sweepActive.discard(i)
+        if self.sweepRepaintWedge and last is not None:
+            # the old and the new pie together, measured forwards from the old trailing edge
+            self.update(self.wedgeRect(last - self.sweepSpan, last + (angle - last) % 360.0))
+        else:
+            self.update(self.sweepRect())
+        self.frameGovernor.addCost(clock.nsecsElapsed())
 
+    def setFrameRate(self, fps):
+        """
+        Applies the governor's rate to the sweep and the dot pulses
+        :param fps: float
+        :return: None
+        """
+        interval = int(1000.0 / fps)
+        self.timeline.setUpdateInterval(interval)
+        self.pulseDriver.setInterval(max(RadarPulseDriver.defaultInterval, interval))
+
+    def stopSweepItems(self):
+        for i in self._sweepActive:
+            i.stop()
+        self._sweepActive = set()
+        self._sweepAngle = None
 
     def showHideAnimatedRadar(self, state):
-        item = getattr(self, "radarAnimItem", None)
-        if item:
-            if state:
-                self.timeline.stop()
-                item.hide()
+        if state:
+            self.timeline.stop()
+            self.stopSweepItems()
+            self._sweepVisible = False
+        else:
+            self._sweepVisible = True
+            if not self._suspended:
+                self.timeline.start()
+        self.update(self.sweepRect())
+
+    def isSuspended(self):
+        return self._suspended
+
+    def suspend(self):
+        """
+        Called when the scene's tab goes to the background.  The sweep and the pulses stop so a hidden board
+        costs nothing per frame, population and pending label or filter work still finish.
+        :return: None
+        """
+        if self._suspended:
+            return
+        self._suspended = True
+        if self.timeline.state() == QtCore.QTimeLine.Running:
+            self.timeline.setPaused(True)
+        self.stopSweepItems()
+        self.pulseDriver.stopAll()
+
+    def resume(self):
+        if not self._suspended:
+            return
+        self._suspended = False
+        if self._sweepVisible:
+            if self.timeline.state() == QtCore.QTimeLine.Paused:
+                self.timeline.setPaused(False)
             else:
-                item.show()
                 self.timeline.start()
+        self.update()
+
+    def teardown(self):
+        """
+        Releases everything the scene holds once its tab is closed.  Timers are stopped, the shared panels are
+        disconnected and the models and db handle dropped so the scene can be deleted.
+        :return: None
+        """
+        self._suspended = True
+        self.dragStream.setEnabled(False)
+        self.stopPopulate()
+        self._filterTimer.stop()
+        self._selectionTimer.stop()
+        self._overviewTimer.stop()
+        self._overviewDirty = set()
+        self.heatmapLayer.stop()
+        self.timeline.stop()
+        self.stopSweepItems()
+        self.pulseDriver.stopAll()
+        if self.listPanel:
+            # each one on its own, a failed disconnect must not leave the rest wired to the closed scene
+            for signal, slot in ((self.listPanel.form.filter_lineEdit.textChanged, self.proxyModel.setFilterRegExp),
+                                 (self.listPanel.radarListSelectionChanged, self.selectRadarItemsByID),
+                                 (self.selectionChanged, self.scheduleSelectionSync)):
+                try:
+                    signal.disconnect(slot)
+                except (RuntimeError, TypeError):
+                    log.debug("Scene signal already disconnected : {0}".format(slot.__name__))
+        self.sweepIndex = RadarSweepIndex(self.maxRadarDiameter() / 2)
+        self.clusterLayer.clear()
+        self.labelLayer.clear()
+        self._itemDict = {}
+        self._hiddenSelection = set()
+        self.clear()
+        if self.sourceModel:
+            self.sourceModel.store.clear()
+        self.sourceModel = None
+        self.proxyModel = None
+        self.mongoSceneHandle = None
+        self.attributeEditor = None
+        self.listPanel = None
 
     def mouseDoubleClickEvent(self, QGraphicsSceneMouseEvent):
         if QGraphicsSceneMouseEvent.button() == QtCore.Qt.LeftButton and \
@@ -365,22 +2050,32 @@ class RadarGraphicsScene(QtGui.QGraphicsScene):
         if item:
             if getattr(item, "id", ""):
                 item.cachePosition()
-                self.updateItemRecord(item)
-                self.listPanel.selectRadarItem(self, item)
                 self.attributeEditor.setRadarItem(item)
-            return super(RadarGraphicsScene, self).mousePressEvent(QGraphicsSceneMouseEvent)
+            result = super(RadarGraphicsScene, self).mousePressEvent(QGraphicsSceneMouseEvent)
+            self._dragging = QGraphicsSceneMouseEvent.button() == QtCore.Qt.LeftButton
+            # the whole selection moves with the drag, remember where each item started
+            for selected in self.selectedItems():
+                if getattr(selected, "id", ""):
+                    selected.cachePosition()
+            return result
 
     def mouseReleaseEvent(self, QGraphicsSceneMouseEvent):
+        if self._dragging:
+            self._dragging = False
+            self.dragStream.finish()
         item = self.itemAt(QGraphicsSceneMouseEvent.scenePos())
+        candidates = set(i for i in self.selectedItems() if getattr(i, "id", ""))
         if getattr(item, "id", ""):
-            if item.hasMoved():
-                item.cachePosition()
-                index = self.radarItemToSourceIndex(item, 'pos')
-                log.debug("Item Moved")
-                self.sourceModel.setData(index,
-                                         [item.scenePos().x(), item.scenePos().y()],
-                                         QtCore.Qt.EditRole)
-                self.proxyModel.reset()
+            candidates.add(item)
+        moved = [i for i in candidates if i.hasMoved()]
+        if moved:
+            log.debug("Items Moved : {0}".format(len(moved)))
+            positions = []
+            for i in moved:
+                i.cachePosition()
+                pos = i.scenePos()
+                positions.append((i.id(), pos.x(), pos.y()))
+            self.sourceModel.setPositions(positions)
 
         return super(RadarGraphicsScene, self).mouseReleaseEvent(QGraphicsSceneMouseEvent)
 
@@ -388,27 +2083,23 @@ class RadarGraphicsScene(QtGui.QGraphicsScene):
         record = self.sourceModel.addNewRadarItem()
         graphicsItem = RadarGraphicsItem()
         graphicsItem.setId(record["_id"])
-        self.sourceModel.updateGraphicsItemColour.connect(graphicsItem.updateColour)
         self.addItem(graphicsItem)
         graphicsItem.setPos(pos)
-        graphicsItem.record = record
-        self.mongoSceneHandle.updatePosition(record["_id"], pos.x(), pos.y())
+        graphicsItem.cachePosition()
+        # go through the model so the shared record and the sort order pick up the position
+        self.sourceModel.setData(self.radarItemToSourceIndex(graphicsItem, 'pos'), [pos.x(), pos.y()],
+                                 QtCore.Qt.EditRole)
         self.radarItemAdded.emit(graphicsItem)
 
     def filterRadarItems(self):
         """
         :return:
         """
-        # Probably should use layers!
-        return [i for i in self.items() if getattr(i, "id", "")]
+        return self._itemDict.values()
 
     def itemFromID(self, idx):
-        if idx in self._itemDict:
-            return self._itemDict[idx]
-        log.debug("finding RadarGraphicsItem in scene by ID : {0}".format(idx))
-        found = [i for i in self.filterRadarItems() if i.id() == idx]
-        if found:
-            return found[0]
+        # every radar item is registered by its str id, so a miss is an item that is not in the scene
+        return self._itemDict.get(str(idx))
 
 
 class ExtendedQLabel(QtGui.QLabel):
@@ -473,6 +2164,11 @@ class CentralWidget(QtGui.QWidget):
         self.tabIcon = QtGui.QIcon(g_IMAGES_PATH + "/radarTabIcon.png")
         self.tabContainer.setTabsClosable(True)
         self.tabContainer.tabCloseRequested.connect(self.closeTab)
+        # only the scene in the current tab animates, the others are suspended
+        self._activeView = None
+        self._idle = False
+        self._minimized = False
+        self.tabContainer.currentChanged.connect(self.activateTab)
 
     def updateSceneName(self, idx, name):
         openIds = self.openSceneIds(asString=True)
@@ -480,15 +2176,47 @@ class CentralWidget(QtGui.QWidget):
             index = openIds.index(idx)
             self.tabContainer.setTabText(index, name)
 
+    def activateTab(self, tabIndex):
+        view = self.tabContainer.widget(tabIndex)
+        if view is self._activeView:
+            return
+        if self._activeView is not None:
+            self._activeView.scene.suspend()
+        self._activeView = view
+        if view is not None:
+            view.scene.frameGovernor.setIdle(self._idle)
+            if not self._minimized:
+                view.scene.resume()
+
+    def setIdle(self, idle, minimized=False):
+        """
+        :param idle: bool, the window has lost focus
+        :param minimized: bool, the window is minimised, the current scene is suspended as well
+        :return: None
+        """
+        self._idle = idle
+        self._minimized = minimized
+        view = self._activeView
+        if view is not None:
+            view.scene.frameGovernor.setIdle(idle)
+            if minimized:
+                view.scene.suspend()
+            else:
+                view.scene.resume()
+
     def closeTab(self, tabIndex):
         log.debug("Close : {0}".format(tabIndex))
-        self.tabContainer.removeTab(tabIndex)
         widget = self.tabContainer.widget(tabIndex)
-        try:
-            widget.close()
-            widget.deletLater()
-        except:pass
+        self.tabContainer.removeTab(tabIndex)
+        if widget is self._activeView:
+            self._activeView = None
         self.tabClosed.emit(tabIndex)
+        if widget is not None:
+            scene = widget.scene
+            scene.teardown()
+            widget.close()
+            widget.deleteLater()
+            scene.deleteLater()
 
     def openSceneIds(self, asString=False):
         ids = []
@@ -510,16 +2238,148 @@ class CentralWidget(QtGui.QWidget):
         return views
 
     def addRadarGraphicsView(self, name, view):
+        # new boards start suspended, activateTab resumes the one that becomes current
+        if view is not self._activeView:
+            view.scene.suspend()
         self.tabContainer.addTab(view, self.tabIcon, name)
 
 
 class RadarGraphicsView(QtGui.QGraphicsView):
+    """
+    Wheel to zoom about the cursor, middle mouse drag to pan.  Left drag on empty space draws a rubber band and
+    alt + left drag a freehand lasso, ctrl adds to the selection.  Area selections are answered by the scene's
+    columnar store rather than the scene index.
+    """
+    zoomChanged = Signal(float)
+
+    minZoom = 0.1
+    maxZoom = 20.0
+    zoomStep = 1.15
+
     def __init__(self, scene, parent=None):
         super(RadarGraphicsView, self).__init__(parent)
         self.scene = scene
         self.setScene(self.scene)
         self.setRenderHints(QtGui.QPainter.Antialiasing | QtGui.QPainter.SmoothPixmapTransform)
         self.setAttribute(QtCore.Qt.WA_DeleteOnClose)
+        self.setTransformationAnchor(QtGui.QGraphicsView.AnchorUnderMouse)
+        self.setResizeAnchor(QtGui.QGraphicsView.AnchorViewCenter)
+        # dots repaint small rects and the sweep one wedge, let Qt choose between a region and a bounding rect
+        self.setViewportUpdateMode(QtGui.QGraphicsView.SmartViewportUpdate)
+        # The scene already caches the radar background as a pixmap and repaints it under the sweep every
+        # frame, a view side background cache would only be invalidated every frame
+        self.setCacheMode(QtGui.QGraphicsView.CacheNone)
+        # items set every pen, brush and font they use and their bounding rects include the antialiased edge
+        self.setOptimizationFlags(QtGui.QGraphicsView.DontSavePainterState |
+                                  QtGui.QGraphicsView.DontAdjustForAntialiasing)
+        self._panPos = None
+        self._areaOrigin = None
+        self._areaAdd = False
+        self._lasso = None
+        self._rubberBand = QtGui.QRubberBand(QtGui.QRubberBand.Rectangle, self.viewport())
+        self.lassoPen = QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255, 180), 0, QtCore.Qt.DashLine)
+        self.zoomChanged.connect(self.scene.setViewZoom)
+
+    def zoom(self):
+        return self.transform().m11()
+
+    def setZoom(self, zoom):
+        zoom = min(max(zoom, self.minZoom), self.maxZoom)
+        factor = zoom / self.zoom()
+        if factor != 1.0:
+            self.scale(factor, factor)
+            self.zoomChanged.emit(zoom)
+
+    def resetZoom(self):
+        self.setZoom(1.0)
+
+    def wheelEvent(self, event):
+        self.setZoom(self.zoom() * self.zoomStep ** (event.delta() / 120.0))
+        event.accept()
+
+    def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.MiddleButton:
+            self._panPos = event.pos()
+            self.viewport().setCursor(QtCore.Qt.ClosedHandCursor)
+            event.accept()
+            return
+        if event.button() == QtCore.Qt.LeftButton and not getattr(self.itemAt(event.pos()), "id", ""):
+            self._areaOrigin = event.pos()
+            self._areaAdd = bool(event.modifiers() & QtCore.Qt.ControlModifier)
+            if event.modifiers() & QtCore.Qt.AltModifier:
+                self._lasso = [event.pos()]
+            else:
+                self._rubberBand.setGeometry(QtCore.QRect(event.pos(), QtCore.QSize()))
+                self._rubberBand.show()
+            event.accept()
+            return
+        return super(RadarGraphicsView, self).mousePressEvent(event)
+
+    def mouseMoveEvent(self, event):
+        if self._panPos is not None:
+            delta = event.pos() - self._panPos
+            self._panPos = event.pos()
+            self.horizontalScrollBar().setValue(self.horizontalScrollBar().value() - delta.x())
+            self.verticalScrollBar().setValue(self.verticalScrollBar().value() - delta.y())
+            event.accept()
+            return
+        if self._areaOrigin is not None:
+            if self._lasso is not None:
+                # a point every few pixels is plenty and keeps the polygon test short
+                if (event.pos() - self._lasso[-1]).manhattanLength() >= 4:
+                    self._lasso.append(event.pos())
+                    self.viewport().update(self.lassoRect())
+            else:
+                self._rubberBand.setGeometry(QtCore.QRect(self._areaOrigin, event.pos()).normalized())
+            event.accept()
+            return
+        return super(RadarGraphicsView, self).mouseMoveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        if event.button() == QtCore.Qt.MiddleButton and self._panPos is not None:
+            self._panPos = None
+            self.viewport().unsetCursor()
+            event.accept()
+            return
+        if event.button() == QtCore.Qt.LeftButton and self._areaOrigin is not None:
+            self.finishAreaSelection(event.pos())
+            event.accept()
+            return
+        return super(RadarGraphicsView, self).mouseReleaseEvent(event)
+
+    def lassoRect(self):
+        return QtGui.QPolygon(self._lasso).boundingRect().adjusted(-2, -2, 2, 2)
+
+    def finishAreaSelection(self, pos):
+        if self._lasso is not None:
+            self.viewport().update(self.lassoRect())
+        origin = self._areaOrigin
+        lasso = self._lasso
+        self._areaOrigin = None
+        self._lasso = None
+        self._rubberBand.hide()
+
+        if (pos - origin).manhattanLength() < QtGui.QApplication.startDragDistance():
+            # a click on empty space
+            if not self._areaAdd:
+                self.scene.setSelectedIds([])
+            return
+        if lasso is not None:
+            lasso.append(pos)
+            ids = self.scene.radarItemIdsInPolygon(self.mapToScene(QtGui.QPolygon(lasso)))
+        else:
+            ids = self.scene.radarItemIdsInRect(self.mapToScene(QtCore.QRect(origin, pos).normalized()).boundingRect())
+        # the scene pushes the selection to the list panel, and the bulk actions read it back from the scene
+        self.scene.setSelectedIds(ids, add=self._areaAdd)
+
+    def drawForeground(self, painter, rect):
+        super(RadarGraphicsView, self).drawForeground(painter, rect)
+        if self._lasso:
+            painter.save()
+            painter.setPen(self.lassoPen)
+            painter.setBrush(QtCore.Qt.NoBrush)
+            painter.drawPolyline(self.mapToScene(QtGui.QPolygon(self._lasso)))
+            painter.restore()
 
 
 class SceneFilterProxyMode(QtGui.QSortFilterProxyModel):
@@ -547,17 +2407,50 @@ class SceneFilterProxyMode(QtGui.QSortFilterProxyModel):
             return baseAccept
 
 class ItemFilterProxyMode(QtGui.QSortFilterProxyModel):
+    # record fields filterAcceptsRow reads, edits to anything else cannot change the rows
+    filterFields = frozenset(["pos", "zone", "tags", "name"])
+
     def __init__(self, parent=None):
         super(ItemFilterProxyMode, self).__init__(parent)
         self.__tags = set()
         self.__zones = set()
+        # the filter is not dynamic, edits re-run it once per event loop pass however many records changed
+        self._refilterTimer = QtCore.QTimer(self)
+        self._refilterTimer.setSingleShot(True)
+        self._refilterTimer.setInterval(0)
+        self._refilterTimer.timeout.connect(self.refilter)
         self.setFilterCaseSensitivity(QtCore.Qt.CaseInsensitive)
         self.setSortCaseSensitivity(QtCore.Qt.CaseInsensitive)
+        self.setSortRole(RadarItemsTableModel.SortRole)
+
+    def sort(self, column, order=QtCore.Qt.AscendingOrder):
+        """
+        The source model sorts itself on cached native keys, so the proxy just keeps the source order
+        rather than comparing every pair of rows through data()
+        :param column: int
+        :param order: QtCore.Qt.SortOrder
+        :return: None
+        """
+        self.sourceModel().sort(column, order)
 
     @property
     def zones(self):
         return self.__zones
 
+    def recordChanged(self, idx, field):
+        self.recordsChanged([idx], field)
+
+    def recordsChanged(self, ids, field):
+        if field in self.filterFields and self.isFiltering() and not self._refilterTimer.isActive():
+            self._refilterTimer.start()
+
+    def refilter(self):
+        if self.isFiltering():
+            self.invalidateFilter()
+
+    def isFiltering(self):
+        return bool(self.__tags or self.__zones or not self.filterRegExp().isEmpty())
+
     @property
     def tags(self):
         return self.__tags
@@ -590,23 +2483,18 @@ class ItemFilterProxyMode(QtGui.QSortFilterProxyModel):
         acceptTag = True
         acceptZone = True
         contains_filter = True
+        # read the shared record directly, this runs for every row on every filter change
+        record = self.sourceModel().rawDataFromRow(sourceRow)
         if self.__tags:
-            subColumnIndex = self.sourceModel().columns.index('tags')
-            subscribersIndex = self.sourceModel().index(sourceRow, subColumnIndex, sourceParent)
-            data = set([n for n in self.sourceModel().data(subscribersIndex).split(',') if n])
-            acceptTag = bool(data & self.__tags)
+            acceptTag = not self.__tags.isdisjoint(record.tags)
         if self.__zones:
-            subColumnIndex = self.sourceModel().columns.index('zone')
-            subscribersIndex = self.sourceModel().index(sourceRow, subColumnIndex, sourceParent)
-            acceptZone = self.sourceModel().data(subscribersIndex) in self.__zones
+            # the zone is persisted with the position so this is a field read, not a calculation
+            acceptZone = record.zone in self.__zones
 
         regEx = self.filterRegExp()
         if not regEx.isEmpty():
             patern = regEx.pattern().lower()
-            nameColumnIndex = self.sourceModel().columns.index('name')
-            nameIndex = self.sourceModel().index(sourceRow, nameColumnIndex, sourceParent)
-            filter_text = self.sourceModel().data(nameIndex, self.filterRole()).lower()
-            contains_filter = patern in filter_text
+            contains_filter = patern in (record.name or "").lower()
 
         if all([self.__zones, self.__tags]):
             return all([acceptTag, acceptZone, contains_filter])
@@ -861,9 +2749,215 @@ class TagFieldWidget(QtGui.QWidget):
         self.tagRemoved.emit(tag)
 
 
+class RadarMinimap(QtGui.QWidget):
+    """
+    The whole radar in a small cached image with the view's visible area drawn over it.  Click or drag to move
+    the view.  Dots are drawn into the image only when the scene reports them dirty and only the pixels around
+    them are repainted, painting the widget is a single image blit.
+    """
+    # minimap pixels per bucket of the dot grid used to find the dots inside a dirty rect
+    cellPixels = 8
+    dotSize = 2
+
+    def __init__(self, parent=None):
+        super(RadarMinimap, self).__init__(parent)
+        self.setMinimumSize(120, 120)
+        self.setCursor(QtCore.Qt.PointingHandCursor)
+        self.backgroundColour = QtGui.QColor.fromRgb(20, 12, 12)
+        self.viewportPen = QtGui.QPen(QtGui.QColor.fromRgb(255, 255, 255, 200), 1)
+        self._view = None
+        self._scene = None
+        self._image = None
+        self._background = None
+        self._colours = {}
+        self._entries = {}
+        self._cells = {}
+        self._scale = 1.0
+        self._offset = QtCore.QPointF()
+
+    def sizeHint(self):
+        return QtCore.QSize(200, 200)
+
+    def setGraphicsView(self, view):
+        if view is self._view:
+            return
+        if self._view is not None:
+            try:
+                self._view.horizontalScrollBar().valueChanged.disconnect(self.update)
+                self._view.verticalScrollBar().valueChanged.disconnect(self.update)
+                self._view.zoomChanged.disconnect(self.update)
+                self._scene.radarItemsDirty.disconnect(self.itemsDirty)
+                self._scene.sceneRectChanged.disconnect(self.rebuild)
+            except (RuntimeError, TypeError):
+                log.debug("Minimap already disconnected")
+        self._view = view
+        self._scene = view.scene if view is not None else None
+        if view is not None:
+            view.horizontalScrollBar().valueChanged.connect(self.update)
+            view.verticalScrollBar().valueChanged.connect(self.update)
+            view.zoomChanged.connect(self.update)
+            self._scene.radarItemsDirty.connect(self.itemsDirty)
+            self._scene.sceneRectChanged.connect(self.rebuild)
+        self.rebuild()
+
+    def sceneToImage(self, x, y):
+        return QtCore.QPointF((x - self._offset.x()) * self._scale, (y - self._offset.y()) * self._scale)
+
+    def imageToScene(self, point):
+        return QtCore.QPointF(point.x() / self._scale + self._offset.x(), point.y() / self._scale + self._offset.y())
+
+    def _colour(self, rgb):
+        colour = self._colours.get(rgb)
+        if colour is None:
+            colour = self._colours[rgb] = QtGui.QColor.fromRgb(rgb)
+        return colour
+
+    def _cellKey(self, px, py):
+        return int(px) // self.cellPixels, int(py) // self.cellPixels
+
+    def _addEntry(self, idx, item):
+        pos = self.sceneToImage(item.scenePos().x(), item.scenePos().y())
+        entry = (pos.x(), pos.y(), item.rgb())
+        self._entries[idx] = entry
+        self._cells.setdefault(self._cellKey(entry[0], entry[1]), set()).add(idx)
+        return entry
+
+    def _removeEntry(self, idx):
+        entry = self._entries.pop(idx, None)
+        if entry is not None:
+            key = self._cellKey(entry[0], entry[1])
+            cell = self._cells.get(key)
+            if cell is not None:
+                cell.discard(idx)
+                if not cell:
+                    del self._cells[key]
+        return entry
+
+    def _dotRect(self, entry):
+        size = self.dotSize
+        return QtCore.QRect(int(entry[0]) - size, int(entry[1]) - size, size * 2 + 1, size * 2 + 1)
+
+    def rebuild(self, *args):
+        """
+        Full redraw, only needed for a new scene, a resize or a new scene rect
+        :return: None
+        """
+        self._entries = {}
+        self._cells = {}
+        side = min(self.width(), self.height())
+        if self._scene is None or side <= 0:
+            self._image = None
+            self.update()
+            return
+        radarRect = self._scene.radarRect()
+        self._scale = side / radarRect.width()
+        # centre the radar in the widget
+        self._offset = QtCore.QPointF(radarRect.x() - (self.width() - side) / 2.0 / self._scale,
+                                      radarRect.y() - (self.height() - side) / 2.0 / self._scale)
+
+        self._background = QtGui.QImage(self.size(), QtGui.QImage.Format_ARGB32_Premultiplied)
+        self._background.fill(self.backgroundColour.rgb())
+        painter = QtGui.QPainter(self._background)
+        painter.setRenderHint(QtGui.QPainter.Antialiasing)
+        painter.scale(self._scale, self._scale)
+        painter.translate(-self._offset.x(), -self._offset.y())
+        self._scene.paintRadarBackground(painter)
+        painter.end()
+
+        for item in self._scene.radarItems():
+            if not self._scene.isHiddenByFilter(item):
+                self._addEntry(item.id(), item)
+        self._image = self._background.copy()
+        self.repaintRegion(self._image.rect())
+
+    def itemsDirty(self, ids):
+        if self._image is None:
+            return
+        dirty = QtCore.QRect()
+        for idx in ids:
+            old = self._removeEntry(idx)
+            if old is not None:
+                dirty = dirty.united(self._dotRect(old))
+            item = self._scene.itemFromID(idx)
+            if item is not None and not self._scene.isHiddenByFilter(item):
+                dirty = dirty.united(self._dotRect(self._addEntry(idx, item)))
+        if not dirty.isNull():
+            self.repaintRegion(dirty)
+
+    def repaintRegion(self, rect):
+        """
+        Restores the background under the rect and draws the dots that fall in it
+        :param rect: QtCore.QRect, minimap pixels
+        :return: None
+        """
+        rect = rect.intersected(self._image.rect())
+        if rect.isEmpty():
+            return
+        painter = QtGui.QPainter(self._image)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_Source)
+        painter.drawImage(rect, self._background, rect)
+        painter.setCompositionMode(QtGui.QPainter.CompositionMode_SourceOver)
+        painter.setClipRect(rect)
+        size = self.dotSize
+        reach = size + 1
+        left, top = self._cellKey(max(rect.left() - reach, 0), max(rect.top() - reach, 0))
+        right, bottom = self._cellKey(rect.right() + reach, rect.bottom() + reach)
+        for cx in xrange(left, right + 1):
+            for cy in xrange(top, bottom + 1):
+                for idx in self._cells.get((cx, cy), ()):
+                    x, y, rgb = self._entries[idx]
+                    painter.fillRect(int(x) - size / 2, int(y) - size / 2, size, size, self._colour(rgb))
+        painter.end()
+        self.update(rect)
+
+    def viewportRect(self):
+        view = self._view
+        sceneRect = view.mapToScene(view.viewport().rect()).boundingRect()
+        topLeft = self.sceneToImage(sceneRect.left(), sceneRect.top())
+        bottomRight = self.sceneToImage(sceneRect.right(), sceneRect.bottom())
+        return QtCore.QRectF(topLeft, bottomRight)
+
+    def paintEvent(self, event):
+        painter = QtGui.QPainter(self)
+        if self._image is None:
+            painter.fillRect(self.rect(), self.backgroundColour)
+            return
+        painter.drawImage(event.rect(), self._image, event.rect())
+        painter.setPen(self.viewportPen)
+        painter.setBrush(QtCore.Qt.NoBrush)
+        painter.drawRect(self.viewportRect())
+
+    def resizeEvent(self, event):
+        super(RadarMinimap, self).resizeEvent(event)
+        self.rebuild()
+
+    def centreView(self, pos):
+        if self._view is not None:
+            self._view.centerOn(self.imageToScene(pos))
+
+    def mousePressEvent(self, event):
+        if event.button() == QtCore.Qt.LeftButton:
+            self.centreView(event.pos())
+
+    def mouseMoveEvent(self, event):
+        if event.buttons() & QtCore.Qt.LeftButton:
+            self.centreView(event.pos())
+
+
+class RadarOverviewPanel(QtGui.QDockWidget):
+    def __init__(self, parent=None):
+        super(RadarOverviewPanel, self).__init__(" Radar Overview", parent)
+        self.setAllowedAreas(QtCore.Qt.LeftDockWidgetArea | QtCore.Qt.RightDockWidgetArea)
+        self.minimap = RadarMinimap(self)
+        self.setWidget(self.minimap)
+
+    def setGraphicsView(self, view):
+        self.minimap.setGraphicsView(view)
+
+
 class RadarListPanel(QtGui.QDockWidget):
 
-    radarListSelectionChanged = Signal(RadarGraphicsScene, str)
+    radarListSelectionChanged = Signal(RadarGraphicsScene, list)
 
     def __init__(self, parent=None):
         super(RadarListPanel, self).__init__(" Radar List", parent)
@@ -872,8 +2966,9 @@ class RadarListPanel(QtGui.QDockWidget):
         self.form = radarListForm.Ui_Form()
         self.form.setupUi(containerWidget)
         self.setWidget(containerWidget)
-        self.form.itemTableView.clicked.connect(self.emitSelectionChange)
+        self.form.itemTableView.setSelectionMode(QtGui.QAbstractItemView.ExtendedSelection)
         self.form.itemTableView.setSortingEnabled(True)
+        self._syncingSelection = False
         self.form.pushButton_filterTags.clicked.connect(self.showFiltersMenu)
         self.form.pushButton_filterZone.clicked.connect(self.showZonesMenu)
         self._scene = None
@@ -927,12 +3022,24 @@ class RadarListPanel(QtGui.QDockWidget):
         menu.exec_()
 
     def setGraphicsScene(self, scene):
+        if scene is self._scene:
+            return
+        # the old model's selection model would otherwise keep calling us alongside the new one
+        selectionModel = self.form.itemTableView.selectionModel()
+        if selectionModel is not None:
+            try:
+                selectionModel.selectionChanged.disconnect(self.emitSelectionChange)
+            except (RuntimeError, TypeError):
+                log.debug("List selection already disconnected")
         if scene:
             self._scene = scene
             self.form.itemTableView.setModel(self._scene.proxyModel)
+            # each model gets a new selection model
+            self.form.itemTableView.selectionModel().selectionChanged.connect(self.emitSelectionChange)
             for col in self._scene.sourceModel.hiddenColumns:
                 self.form.itemTableView.setColumnHidden(col, True)
         else:
+            self._scene = None
             self.form.itemTableView.setModel(None)
 
 
@@ -945,23 +3052,53 @@ class RadarListPanel(QtGui.QDockWidget):
         :param radarItem: RadarGraphicsItem
         :return: None
         """
-        if self.scene is scene:
-            index = self.scene.radarItemToProxyIndex(radarItem)
-            if index.isValid():
-                log.debug("Update List From Selected Item in Scene")
-                self.form.itemTableView.scrollTo(index, QtGui.QAbstractItemView.PositionAtTop)
-                self.form.itemTableView.selectRow(index.row())
-        else:
-            raise LookupError()
+        self.selectRadarItems(scene, [radarItem])
 
-    def emitSelectionChange(self):
-        if self.scene:
+    def selectRadarItems(self, scene, radarItems):
+        """
+        Selects the rows of many radarItems with a single selection change and scrolls to the first
+        :param scene: RadarGraphicsScene
+        :param radarItems: list of RadarGraphicsItem
+        :return: None
+        """
+        if self.scene is not scene:
+            raise LookupError()
+        proxy = scene.proxyModel
+        sourceModel = scene.sourceModel
+        lastColumn = sourceModel.columnCount() - 1
+        rows = []
+        for row in sourceModel.rowsFromIds([i.id() for i in radarItems]):
+            index = proxy.mapFromSource(sourceModel.index(row, 0))
+            if index.isValid():
+                rows.append(index.row())
+        rows.sort()
+
+        # one range per run of adjacent rows rather than one per row
+        selection = QtGui.QItemSelection()
+        start = 0
+        for i in xrange(1, len(rows) + 1):
+            if i == len(rows) or rows[i] != rows[i - 1] + 1:
+                selection.select(proxy.index(rows[start], 0), proxy.index(rows[i - 1], lastColumn))
+                start = i
+        first = proxy.index(rows[0], 0) if rows else None
+
+        log.debug("Update List From Selected Items in Scene")
+        self._syncingSelection = True
+        try:
+            self.form.itemTableView.selectionModel().select(selection, QtGui.QItemSelectionModel.ClearAndSelect)
+        finally:
+            self._syncingSelection = False
+        if first is not None:
+            self.form.itemTableView.scrollTo(first, QtGui.QAbstractItemView.PositionAtTop)
+
+    def emitSelectionChange(self, *args):
+        if self.scene and not self._syncingSelection:
             log.debug("list view selection changed")
-
-            modelIndex = self.form.itemTableView.selectionModel().selectedIndexes()[0]
-            row = self.scene.proxyModel.mapToSource(modelIndex).row()
-            idx = self.scene.sourceModel.rawDataFromRow(row)["_id"]
-            self.radarListSelectionChanged.emit(self.scene, str(idx))
+            proxy = self.scene.proxyModel
+            datatable = self.scene.sourceModel.datatable
+            ids = [str(datatable[proxy.mapToSource(index).row()]._id)
+                   for index in self.form.itemTableView.selectionModel().selectedRows()]
+            self.radarListSelectionChanged.emit(self.scene, ids)
 
 
 class RadarAttributeEditor(QtGui.QDockWidget):
@@ -974,7 +3111,6 @@ class RadarAttributeEditor(QtGui.QDockWidget):
         self.form.setupUi(containerWidget)
         self.setWidget(containerWidget)
         self.radarItem = None
-        self.rowIndexes = {}
         self.tagWidget = TagFieldWidget(self)
         self.form.mainLayout.addWidget(self.tagWidget)
         self.connectSignals()
@@ -994,6 +3130,14 @@ class RadarAttributeEditor(QtGui.QDockWidget):
     def getGraphicsScene(self):
         return self._scene
 
+    def rowIndex(self, columnName):
+        """
+        Looked up on every edit, rows move whenever the model resorts
+        :param columnName: str
+        :return: QtCore.QModelIndex of the current radarItem
+        """
+        return self.scene.sourceModel.indexFromId(self.radarItem.id(), columnName)
+
     def connectSignals(self):
         self.form.name_lineEdit.textChanged.connect(self.writeData)
         self.form.description_plainTextEdit.textChanged.connect(self.writeData)
@@ -1008,7 +3152,7 @@ class RadarAttributeEditor(QtGui.QDockWidget):
         role = QtCore.Qt.EditRole
         if all([self.scene, self.radarItem]):
             if colour.isValid():
-                self.scene.sourceModel.setData(self.rowIndexes["colour"], colour, role)
+                self.scene.sourceModel.setData(self.rowIndex("colour"), colour, role)
 
     def pickColour(self):
         if all([self.scene, self.radarItem]):
@@ -1017,58 +3161,58 @@ class RadarAttributeEditor(QtGui.QDockWidget):
             qCol = QtGui.QColor(rawCol[0], rawCol[1], rawCol[2])
             colour = QtGui.QColorDialog.getColor(qCol, self)
             if colour.isValid():
-                self.scene.sourceModel.setData(self.rowIndexes["colour"], colour, role)
+                self.scene.sourceModel.setData(self.rowIndex("colour"), colour, role)
 
     def postComment(self):
         if all([self.scene, self.radarItem]):
             role = QtCore.Qt.EditRole
             comment = self.form.comments_plainTextEdit.toPlainText()
-            self.scene.sourceModel.setData(self.rowIndexes["comments"], comment, role)
-            self.scene.updateItemRecord(self.radarItem)
+            self.scene.sourceModel.setData(self.rowIndex("comments"), comment, role)
             self.form.comments_plainTextEdit.clear()
             self.setRadarItem(self.radarItem)
 
     def setTags(self, tag):
         if all([self.scene, self.radarItem]):
             role = QtCore.Qt.EditRole
-            currentTags = [n for n in self.rowIndexes["tags"].data(QtCore.Qt.DisplayRole).split(",") if n]
+            currentTags = [n for n in self.rowIndex("tags").data(QtCore.Qt.DisplayRole).split(",") if n]
             if tag.lower() not in currentTags:
                 currentTags.append(tag.lower())
-                self.scene.sourceModel.setData(self.rowIndexes["tags"], currentTags, role)
+                self.scene.sourceModel.setData(self.rowIndex("tags"), currentTags, role)
 
     def removeTag(self, tag):
         if all([self.scene, self.radarItem]):
             role = QtCore.Qt.EditRole
-            currentTags = [n for n in self.rowIndexes["tags"].data(QtCore.Qt.DisplayRole).split(",") if n]
+            currentTags = [n for n in self.rowIndex("tags").data(QtCore.Qt.DisplayRole).split(",") if n]
             if tag.lower() in currentTags:
                 currentTags.remove(tag.lower())
-                self.scene.sourceModel.setData(self.rowIndexes["tags"], currentTags, role)
+                self.scene.sourceModel.setData(self.rowIndex("tags"), currentTags, role)
 
 
     def setRadarItem(self, radarItem):
 
         if all([radarItem, self.scene]):
             self.radarItem = radarItem
-            self.rowIndexes = self.scene.sourceModel.rowModelIndexFromId(self.radarItem.id())
+            # one lookup, the graphics item does not hold its record
+            record = self.radarItem.record
 
-            self.form.name_lineEdit.setText(self.radarItem.record["name"])
-            self.form.description_plainTextEdit.setPlainText(self.radarItem.record["description"])
+            self.form.name_lineEdit.setText(record["name"])
+            self.form.description_plainTextEdit.setPlainText(record["description"])
             story = ""
-            for i in reversed(range(len(self.radarItem.record["comments"]))):
-                cHist = self.radarItem.record["comments"][i]
+            for i in reversed(range(len(record["comments"]))):
+                cHist = record["comments"][i]
                 post = "-"*10
                 post+="\ncommnet by : {0}  date : {1}\n\n".format(cHist["user"], cHist["date"])
                 post+= cHist["text"]
                 story+= post + "\n"
             self.form.commentHistory_plainTextEdit.setPlainText(story)
 
-            self.form.createdBy_lineEdit.setText(self.radarItem.record["created_by"])
-            self.form.createdOn_lineEdit.setText(self.radarItem.record["created_on"].strftime("%Y-%m-%d:%X"))
+            self.form.createdBy_lineEdit.setText(record["created_by"])
+            self.form.createdOn_lineEdit.setText(record["created_on"].strftime("%Y-%m-%d:%X"))
 
-            self.form.link_lineEdit.setText(self.radarItem.record["link"])
+            self.form.link_lineEdit.setText(record["link"])
 
             self.tagWidget.clearTags()
-            self.tagWidget.setTags(self.radarItem.record["tags"])
+            self.tagWidget.setTags(record["tags"])
         else:
             self.tagWidget.clearTags()
             self.form.name_lineEdit.setText("")
@@ -1086,16 +3230,15 @@ class RadarAttributeEditor(QtGui.QDockWidget):
             model = self.scene.sourceModel
             if self.radarItem:
                 if sender is self.form.name_lineEdit:
-                    model.setData(self.rowIndexes["name"], self.form.name_lineEdit.text(), role)
+                    model.setData(self.rowIndex("name"), self.form.name_lineEdit.text(), role)
                     self.radarItem.record['name'] = self.form.name_lineEdit.text()
                 elif sender is self.form.description_plainTextEdit:
-                    model.setData(self.rowIndexes["description"], self.form.description_plainTextEdit.toPlainText(), role)
+                    model.setData(self.rowIndex("description"), self.form.description_plainTextEdit.toPlainText(), role)
                 elif sender is self.form.link_lineEdit:
-                    model.setData(self.rowIndexes["link"], self.form.link_lineEdit.text(), role)
+                    model.setData(self.rowIndex("link"), self.form.link_lineEdit.text(), role)
 
     def clearData(self):
         self.radarItem = None
-        self.rowIndexes = {}
         self.setRadarItem(None)
 
 
@@ -1134,15 +3277,27 @@ class MainWindow(QtGui.QMainWindow):
         self.attributeEditor = RadarAttributeEditor(self)
         self.addDockWidget(QtCore.Qt.RightDockWidgetArea, self.attributeEditor)
 
+        self.overviewPanel = RadarOverviewPanel(self)
+        self.addDockWidget(QtCore.Qt.LeftDockWidgetArea, self.overviewPanel)
+
         self.centralTab.tabClosed.connect(self.sceneTabClosed)
 
         self.setMinimumSize(800, 1024)
 
+    def changeEvent(self, event):
+        """
+        The radar runs at the idle frame rate while the window is in the background and stops when minimised
+        """
+        if event.type() in (QtCore.QEvent.ActivationChange, QtCore.QEvent.WindowStateChange) and \
+                getattr(self, "centralTab", None):
+            self.centralTab.setIdle(not self.isActiveWindow(), self.isMinimized())
+        super(MainWindow, self).changeEvent(event)
+
     def update_progress(self, n, nrows):
         self.pb.show()
         self.pb.setRange(0, nrows)
         self.pb.setValue(n)
-        self.statusBar().showMessage(self.tr("Parsing eventlog data..."))
+        self.statusBar().showMessage(self.tr("Loading radar items..."))
 
     def hide_progress_bar(self):
         self.pb.hide()
@@ -1176,6 +3331,28 @@ class MainWindow(QtGui.QMainWindow):
         self.exportAct.setStatusTip(self.tr("Export the current scene to a json file"))
         self.exportAct.triggered.connect(self.exportScene)
 
+        self.showLabelsAct = QtGui.QAction(self.tr("Show &Labels"), self, checkable=True)
+        self.showLabelsAct.setChecked(True)
+        self.showLabelsAct.setStatusTip(self.tr("Show the item names next to the dots"))
+        self.showLabelsAct.toggled.connect(self.setLabelsEnabled)
+
+        self.dimFilteredAct = QtGui.QAction(self.tr("&Dim Filtered Items"), self, checkable=True)
+        self.dimFilteredAct.setStatusTip(self.tr("Fade the items rejected by the list filters instead of hiding them"))
+        self.dimFilteredAct.toggled.connect(self.setDimFiltered)
+
+        self.heatmapAct = QtGui.QAction(self.tr("Density &Heatmap"), self, checkable=True)
+        self.heatmapAct.setStatusTip(self.tr("Shade the radar by how densely packed the items are"))
+        self.heatmapAct.toggled.connect(self.setHeatmapEnabled)
+
+        self.liveDragAct = QtGui.QAction(self.tr("Live &Drag"), self, checkable=True)
+        self.liveDragAct.setStatusTip(self.tr("Share item drags with other users while they happen"))
+        self.liveDragAct.toggled.connect(self.setLiveDrag)
+
+        self.refreshAct = QtGui.QAction(self.tr("&Refresh"), self)
+        self.refreshAct.setShortcut(self.tr("F5"))
+        self.refreshAct.setStatusTip(self.tr("Pick up changes other users have made to the current scene"))
+        self.refreshAct.triggered.connect(self.refreshScene)
+
         #  TOOLBAR ACTIONS
         self.tb_exitAction = QtGui.QAction(QtGui.QIcon('exit24.png'), 'Exit', self)
         self.tb_exitAction.setShortcut('Ctrl+Q')
@@ -1193,6 +3370,13 @@ class MainWindow(QtGui.QMainWindow):
         self.fileMenu.addAction(self.exitAct)
         self.fileMenu.addAction(self.exportAct)
 
+        self.viewMenu = self.menuBar().addMenu(self.tr("&View"))
+        self.viewMenu.addAction(self.showLabelsAct)
+        self.viewMenu.addAction(self.dimFilteredAct)
+        self.viewMenu.addAction(self.heatmapAct)
+        self.viewMenu.addAction(self.liveDragAct)
+        self.viewMenu.addAction(self.refreshAct)
+
         self.helpMenu = self.menuBar().addMenu(self.tr("&Help"))
         self.helpMenu.addAction(self.aboutAct)
 
@@ -1211,14 +3395,39 @@ class MainWindow(QtGui.QMainWindow):
         radarGraphicsView = self.centralTab.tabContainer.widget(tabIndex)
         if radarGraphicsView:
             radarGraphicsView.scene.setActive()
-        else:
-            pass
+        self.overviewPanel.setGraphicsView(radarGraphicsView)
 
     def sceneTabClosed(self):
         self.attributeEditor.setGraphicsScene(None)
         self.itemListPanel.setGraphicsScene(None)
         self.connectModel(self.centralTab.tabContainer.currentIndex())
 
+    def setLabelsEnabled(self, state):
+        for view in self.centralTab.getGraphicsViews():
+            view.scene.setLabelsEnabled(state)
+
+    def filterMode(self):
+        if self.dimFilteredAct.isChecked():
+            return RadarGraphicsScene.DIM_FILTERED
+        return RadarGraphicsScene.HIDE_FILTERED
+
+    def setDimFiltered(self, state):
+        for view in self.centralTab.getGraphicsViews():
+            view.scene.setFilterMode(self.filterMode())
+
+    def setHeatmapEnabled(self, state):
+        for view in self.centralTab.getGraphicsViews():
+            view.scene.heatmapLayer.setEnabled(state)
+
+    def setLiveDrag(self, state):
+        for view in self.centralTab.getGraphicsViews():
+            view.scene.dragStream.setEnabled(state)
+
+    def refreshScene(self):
+        view = self.centralTab.tabContainer.currentWidget()
+        if view:
+            view.scene.refresh()
+
     def exportScene(self):
         graphicsViewIndex = self.centralTab.tabContainer.currentIndex()
         if graphicsViewIndex != -1:
@@ -1243,7 +3452,13 @@ class MainWindow(QtGui.QMainWindow):
         mongoSceneHandle = MongoSceneHandle(sceneRecord)
 
         scene = RadarGraphicsScene(-400,-300,800,600, self)
+        scene.populateProgress.connect(self.update_progress)
+        scene.populateFinished.connect(self.hide_progress_bar)
         scene.initScene(mongoSceneHandle, self.attributeEditor, self.itemListPanel)
+        scene.setLabelsEnabled(self.showLabelsAct.isChecked())
+        scene.setFilterMode(self.filterMode())
+        scene.dragStream.setEnabled(self.liveDragAct.isChecked())
+        scene.heatmapLayer.setEnabled(self.heatmapAct.isChecked())
         radar = RadarGraphicsView(scene, self)
 
         self.centralTab.addRadarGraphicsView(sceneRecord["name"], radar)
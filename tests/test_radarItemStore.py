@@ -0,0 +1,88 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import radarItemStore
+
+
+class Record(object):
+    def __init__(self, idx, x, y, tags=(), colour=0, name=""):
+        self._id = idx
+        self.name = name
+        self.x = x
+        self.y = y
+        self.distance = None
+        self.colour = colour
+        self.tags = list(tags)
+
+
+class TestTagSelection(unittest.TestCase):
+    def setUp(self):
+        self.store = radarItemStore.RadarItemStore()
+        self.store.rebuild([Record("a", 1, 1, ["t1"]),
+                            Record("b", -1, 1, ["t1", "t2"]),
+                            Record("c", 1, -1, ["t2"]),
+                            Record("d", -1, -1)])
+
+    def test_match_any(self):
+        self.assertEqual(sorted(self.store.selectTags(["t1"])), ["a", "b"])
+        self.assertEqual(sorted(self.store.selectTags(["t1", "t2"])), ["a", "b", "c"])
+
+    def test_match_all(self):
+        self.assertEqual(self.store.selectTags(["t1", "t2"], matchAll=True), ["b"])
+
+    def test_unknown_tag_is_ignored_for_match_any(self):
+        self.assertEqual(sorted(self.store.selectTags(["t1", "nope"])), ["a", "b"])
+        self.assertEqual(self.store.selectTags(["nope"]), [])
+
+    def test_unknown_tag_matches_nothing_for_match_all(self):
+        self.assertEqual(self.store.selectTags(["t1", "nope"], matchAll=True), [])
+
+    def test_tags_past_the_bit_cap(self):
+        records = [Record("r%d" % i, 1, 1, ["tag%d" % i]) for i in range(radarItemStore.g_MAX_TAG_BITS)]
+        records.append(Record("over", 1, 1, ["t1", "overflow"]))
+        self.store.rebuild(records)
+        self.assertEqual(self.store.selectTags(["overflow", "tag0"]), ["r0"])
+        self.assertEqual(self.store.selectTags(["t1", "overflow"], matchAll=True), [])
+
+
+class TestFilterMask(unittest.TestCase):
+    def setUp(self):
+        self.store = radarItemStore.RadarItemStore()
+        self.store.rebuild([Record("a", -1, -1, ["t1"], name="Alpha"),
+                            Record("b", 1, -1, ["t2"], name="Beta"),
+                            Record("c", -1, 1, ["t1"], name="alphabet"),
+                            Record("d", 1, 1, name="Delta")])
+
+    def accepted(self, **criteria):
+        return sorted(self.store.idsFromMask(self.store.filterMask(**criteria)))
+
+    def test_no_criteria_accepts_everything(self):
+        self.assertEqual(self.accepted(), ["a", "b", "c", "d"])
+
+    def test_criteria_combine(self):
+        self.assertEqual(self.accepted(text="ALPHA"), ["a", "c"])
+        self.assertEqual(self.accepted(tags=["t1"], zones=["P3"]), ["c"])
+        self.assertEqual(self.accepted(zones=["P2", "P4"], text="ta"), ["b", "d"])
+
+    def test_names_follow_edits(self):
+        self.store.update(Record("d", 1, 1, name="Alpine"))
+        self.store.remove("a")
+        self.assertEqual(self.accepted(text="alp"), ["c", "d"])
+
+
+class TestDensityGrid(unittest.TestCase):
+    def test_counts_and_mask(self):
+        store = radarItemStore.RadarItemStore()
+        store.rebuild([Record("a", -5, -5, ["t1"]), Record("b", -4, -4), Record("c", 5, 5, ["t1"]),
+                       Record("out", 50, 50, ["t1"])])
+        grid = store.densityGrid(-10, -10, 20, 20, 2)
+        self.assertEqual(grid.tolist(), [[2.0, 0.0], [0.0, 1.0]])
+        grid = store.densityGrid(-10, -10, 20, 20, 2, mask=store.tagsMask(["t1"]))
+        self.assertEqual(grid.tolist(), [[1.0, 0.0], [0.0, 1.0]])
+
+
+if __name__ == '__main__':
+    unittest.main()